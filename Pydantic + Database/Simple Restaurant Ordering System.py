@@ -1,12 +1,16 @@
 
 # main.py
+# Requires: fastapi, lmdb, orjson  (pip install fastapi lmdb orjson)
 
 from fastapi import FastAPI, HTTPException, Path, status, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator, ValidationError
-from typing import List, Dict, Optional
+from typing import Callable, List, Optional
 from enum import Enum
+import os
 import re
+import lmdb
+import orjson
 
 app = FastAPI(
     title="Restaurant Ordering System",
@@ -14,11 +18,51 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# --- In-memory "databases" and ID counters ---
-menu_db: Dict[int, "FoodItem"] = {}
-orders_db: Dict[int, "Order"] = {}
-next_menu_id = 1
-next_order_id = 1
+# --- LMDB-backed "databases" ---
+# One memory-mapped environment with two named databases. Records are stored
+# as orjson-encoded dicts keyed by the big-endian 8-byte id, so keys sort in
+# id order and data survives restarts. ORDERS_DB_PATH sets where the
+# environment directory lives (default: orders.mdb in the working directory).
+env = lmdb.open(os.environ.get("ORDERS_DB_PATH", "orders.mdb"), map_size=1 << 30, max_dbs=2, writemap=True)
+menu_db = env.open_db(b"menu")
+orders_db = env.open_db(b"orders")
+
+
+def _key(record_id: int) -> bytes:
+    return record_id.to_bytes(8, "big")
+
+
+def _get(db, record_id: int) -> Optional[dict]:
+    with env.begin(db=db) as txn:
+        raw = txn.get(_key(record_id))
+    return orjson.loads(raw) if raw is not None else None
+
+
+def _values(db) -> List[dict]:
+    with env.begin(db=db) as txn:
+        return [orjson.loads(raw) for _, raw in txn.cursor()]
+
+
+def _insert(db, build: Callable[[int], BaseModel]) -> BaseModel:
+    # Allocate the id and store the record in one write transaction; LMDB
+    # serializes writers, so concurrent inserts never share an id.
+    with env.begin(db=db, write=True) as txn:
+        cursor = txn.cursor()
+        record_id = int.from_bytes(cursor.key(), "big") + 1 if cursor.last() else 1
+        record = build(record_id)
+        txn.put(_key(record_id), orjson.dumps(record.dict()), overwrite=False)
+    return record
+
+
+def _update(db, record_id: int, apply: Callable[[dict], BaseModel]) -> Optional[BaseModel]:
+    # Read, modify and write back in one write transaction.
+    with env.begin(db=db, write=True) as txn:
+        raw = txn.get(_key(record_id))
+        if raw is None:
+            return None
+        record = apply(orjson.loads(raw))
+        txn.put(_key(record_id), orjson.dumps(record.dict()))
+    return record
 
 # --- Models ---
 
@@ -124,19 +168,15 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 @app.post("/menu", response_model=FoodItemResponse, status_code=201)
 def create_menu_item(item: FoodItemCreate):
-    global next_menu_id
-    food_item = FoodItem(id=next_menu_id, **item.dict())
-    menu_db[next_menu_id] = food_item
-    next_menu_id += 1
-    return food_item
+    return _insert(menu_db, lambda item_id: FoodItem(id=item_id, **item.dict()))
 
 @app.get("/menu", response_model=List[FoodItemResponse])
 def get_menu():
-    return list(menu_db.values())
+    return _values(menu_db)
 
 @app.get("/menu/{item_id}", response_model=FoodItemResponse)
 def get_menu_item(item_id: int = Path(..., gt=0)):
-    item = menu_db.get(item_id)
+    item = _get(menu_db, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Menu item not found")
     return item
@@ -145,26 +185,23 @@ def get_menu_item(item_id: int = Path(..., gt=0)):
 
 @app.post("/orders", response_model=OrderResponse, status_code=201)
 def create_order(order_data: OrderCreate):
-    global next_order_id
     # Validate menu items exist and fill in names/prices
     items = []
     for item in order_data.items:
-        menu_item = menu_db.get(item.menu_item_id)
+        menu_item = _get(menu_db, item.menu_item_id)
         if not menu_item:
             raise HTTPException(status_code=400, detail=f"Menu item ID {item.menu_item_id} does not exist")
         items.append(OrderItem(
-            menu_item_id=menu_item.id,
-            menu_item_name=menu_item.name,
+            menu_item_id=menu_item["id"],
+            menu_item_name=menu_item["name"],
             quantity=item.quantity,
-            unit_price=menu_item.price
+            unit_price=menu_item["price"]
         ))
-    order = Order(
-        id=next_order_id,
+    order = _insert(orders_db, lambda order_id: Order(
+        id=order_id,
         customer=order_data.customer,
         items=items
-    )
-    orders_db[next_order_id] = order
-    next_order_id += 1
+    ))
     return OrderResponse(
         id=order.id,
         customer=order.customer,
@@ -185,14 +222,15 @@ def list_orders():
             total_items_count=order.total_items_count,
             total_amount=order.total_amount
         )
-        for order in orders_db.values()
+        for order in (Order(**record) for record in _values(orders_db))
     ]
 
 @app.get("/orders/{order_id}", response_model=OrderResponse)
 def get_order(order_id: int = Path(..., gt=0)):
-    order = orders_db.get(order_id)
-    if not order:
+    record = _get(orders_db, order_id)
+    if not record:
         raise HTTPException(status_code=404, detail="Order not found")
+    order = Order(**record)
     return OrderResponse(
         id=order.id,
         customer=order.customer,
@@ -208,10 +246,9 @@ class OrderStatusUpdate(BaseModel):
 
 @app.put("/orders/{order_id}/status", response_model=OrderResponse)
 def update_order_status(order_id: int, status_update: OrderStatusUpdate):
-    order = orders_db.get(order_id)
+    order = _update(orders_db, order_id, lambda record: Order(**{**record, "status": status_update.status}))
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    order.status = status_update.status
     return OrderResponse(
         id=order.id,
         customer=order.customer,
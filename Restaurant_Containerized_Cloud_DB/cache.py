@@ -0,0 +1,45 @@
+from redis.asyncio import ConnectionPool, Redis
+from typing import Optional, Union
+from config import settings, get_redis_url
+import structlog
+
+logger = structlog.get_logger()
+
+# One connection pool per process, shared by the cache, health checks and metrics
+redis_pool = ConnectionPool.from_url(get_redis_url(), max_connections=settings.redis_pool_size)
+redis_cache = Redis(connection_pool=redis_pool)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Return a cached response body, or None on a miss or Redis error."""
+    try:
+        return await redis_cache.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed", error=str(e), key=key)
+        return None
+
+
+async def cache_set(key: str, value: Union[str, bytes], ttl: Optional[int] = None):
+    """Store a response body for a short time; failures are only logged."""
+    try:
+        await redis_cache.set(key, value, ex=ttl or settings.cache_ttl_seconds)
+    except Exception as e:
+        logger.warning("Cache write failed", error=str(e), key=key)
+
+
+async def cache_invalidate(*keys: str):
+    """Drop cached entries after the underlying rows change."""
+    try:
+        await redis_cache.delete(*keys)
+    except Exception as e:
+        logger.warning("Cache invalidation failed", error=str(e), keys=keys)
+
+
+async def cache_invalidate_prefix(prefix: str):
+    """Drop every cached entry whose key starts with prefix (e.g. all pages of a list)."""
+    try:
+        keys = [key async for key in redis_cache.scan_iter(match=f"{prefix}*", count=500)]
+        if keys:
+            await redis_cache.delete(*keys)
+    except Exception as e:
+        logger.warning("Cache invalidation failed", error=str(e), prefix=prefix)
@@ -1,9 +1,36 @@
-from celery import Celery
-from config import get_celery_config
+from celery import Celery, signals
+from kombu import Exchange, Queue
+from config import get_celery_config, settings
+import logging
+import orjson
 import structlog
+import sys
 
 logger = structlog.get_logger()
 
+
+@signals.worker_init.connect
+@signals.beat_init.connect
+def configure_worker_logging(**kwargs):
+    """Give worker and beat processes the API's structlog setup.
+
+    Calls below settings.log_level return before any processor runs, and
+    records are rendered by orjson straight to stdout.
+    """
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.EventRenamer("msg"),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(settings.log_level.upper())),
+        logger_factory=structlog.BytesLoggerFactory(file=sys.stdout.buffer),
+        cache_logger_on_first_use=True,
+    )
+
 # Create Celery instance
 celery_app = Celery("restaurant_system")
 
@@ -13,10 +40,30 @@ celery_app.conf.update(get_celery_config())
 # Auto-discover tasks
 celery_app.autodiscover_tasks(["tasks"])
 
+# Queues consumed by a worker started without -Q. Notifications are
+# low-priority and safe to lose on a broker restart, so they are transient.
+celery_app.conf.task_queues = (
+    Queue("celery"),
+    Queue("orders"),
+    Queue("payments"),
+    Queue("delivery"),
+    Queue("analytics"),
+    Queue("maintenance"),
+    Queue(
+        "notifications",
+        Exchange("notifications", delivery_mode=1),
+        routing_key="notifications",
+        durable=False,
+    ),
+)
+
 # Task routing
 celery_app.conf.task_routes = {
     "tasks.process_order": {"queue": "orders"},
-    "tasks.send_notification": {"queue": "notifications"},
+    "tasks.send_order_notifications": {"queue": "notifications"},
+    "tasks.send_customer_notification": {"queue": "notifications"},
+    "tasks.send_restaurant_notification": {"queue": "notifications"},
+    "tasks.send_driver_reminder": {"queue": "notifications"},
     "tasks.update_restaurant_rating": {"queue": "analytics"},
     "tasks.process_payment": {"queue": "payments"},
     "tasks.assign_delivery_driver": {"queue": "delivery"},
@@ -34,11 +81,15 @@ celery_app.conf.task_time_limit = 30 * 60  # 30 minutes
 celery_app.conf.task_soft_time_limit = 25 * 60  # 25 minutes
 
 # Worker settings
+celery_app.conf.task_acks_late = True  # Redeliver orders if a worker dies mid-task
 celery_app.conf.worker_prefetch_multiplier = 1
 celery_app.conf.worker_max_tasks_per_child = 1000
 celery_app.conf.worker_disable_rate_limits = False
 
-# Result backend settings
+# Result backend settings. Most tasks are fire-and-forget, so results are only
+# stored for tasks that opt in with ignore_result=False (the ones whose task_id
+# the API hands back to clients).
+celery_app.conf.task_ignore_result = True
 celery_app.conf.result_expires = 3600  # 1 hour
 celery_app.conf.result_persistent = True
 
@@ -77,10 +128,8 @@ def health_check():
         from database import check_db_connection
         db_healthy = check_db_connection()
         
-        # Check Redis connection
-        from redis import Redis
-        from config import get_redis_url
-        redis_client = Redis.from_url(get_redis_url())
+        # Check Redis connection (the tasks module's shared client)
+        from tasks import redis_client
         redis_healthy = redis_client.ping()
         
         logger.info(
@@ -11,14 +11,22 @@ class Settings(BaseSettings):
     
     # Redis Configuration
     redis_url: str = "redis://localhost:6379/0"
+    redis_pool_size: int = 20
+    cache_ttl_seconds: int = 30
+    cache_ttl_menu_items: int = 60
+    cache_ttl_categories: int = 300
+    http_cache_max_age: int = 60
     
     # Celery Configuration
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
     celery_timezone: str = "UTC"
+    celery_strict_loading: bool = False  # raiseload("*") on task queries to surface lazy loads
     
     # Application Settings
     secret_key: str = "your-super-secret-key-change-in-production"
+    jwt_algorithm: str = "HS256"
+    access_token_expire_minutes: int = 30
     debug: bool = False
     environment: str = "production"
     log_level: str = "INFO"
@@ -48,11 +56,20 @@ class Settings(BaseSettings):
     max_connections: int = 20
     pool_size: int = 10
     
+    # Password Hashing
+    bcrypt_rounds: int = 10
+    bcrypt_workers: Optional[int] = None  # Defaults to os.cpu_count()
+    bcrypt_max_pending: int = 500
+    
     # Database Pool Configuration
-    db_pool_size: int = 10
+    db_pool_size: int = 20
     db_max_overflow: int = 20
-    db_pool_timeout: int = 30
-    db_pool_recycle: int = 3600
+    db_pool_timeout: int = 5
+    db_pool_recycle: int = 1800
+    db_create_tables_on_startup: bool = True  # gunicorn.conf.py does it once in the master
+    db_statement_timeout_ms: int = 5000  # API queries only; Celery reports may run longer
+    sa_query_cache_size: int = 1200
+    skip_output_validation: bool = False  # Build responses from DB rows with model_construct
     
     class Config:
         env_file = ".env"
@@ -70,6 +87,18 @@ def get_database_url() -> str:
     return settings.database_url
 
 
+def get_async_database_url() -> str:
+    """Get database URL for the asyncpg driver used by the API."""
+    url = settings.database_url
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            url = "postgresql+asyncpg://" + url[len(prefix):]
+            break
+    if settings.environment == "production":
+        return f"{url}?ssl={settings.database_ssl_mode}"
+    return url
+
+
 def get_redis_url() -> str:
     """Get Redis URL with proper configuration."""
     return settings.redis_url
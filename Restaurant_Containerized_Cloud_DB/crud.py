@@ -1,5 +1,9 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import Row, and_, or_, func, select, update, insert
+from passlib.context import CryptContext
+from jose import jwt
+from concurrent.futures import ProcessPoolExecutor
 from models import (
     User, Restaurant, Category, MenuItem, Order, OrderItem, 
     Review, DeliveryDriver, Delivery
@@ -11,20 +15,143 @@ from schemas import (
     DeliveryDriverCreate, DeliveryDriverUpdate, DeliveryCreate, DeliveryUpdate
 )
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
+from config import settings
+import asyncio
+import os
 import structlog
 
 logger = structlog.get_logger()
 
+# Password hashing context, built once per process
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
+
+# bcrypt is CPU-bound, so hashing for async callers runs in a process pool.
+# The pool is created on first use so a preloading server (gunicorn --preload)
+# never forks workers that share one executor's pipes.
+_bcrypt_pool: Optional[ProcessPoolExecutor] = None
+_bcrypt_slots = asyncio.Semaphore(settings.bcrypt_max_pending)
+
+
+def _get_bcrypt_pool() -> ProcessPoolExecutor:
+    """Return this process's bcrypt pool, creating it on first use."""
+    global _bcrypt_pool
+    if _bcrypt_pool is None:
+        _bcrypt_pool = ProcessPoolExecutor(max_workers=settings.bcrypt_workers or os.cpu_count())
+    return _bcrypt_pool
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when too many password hashes are already pending."""
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password (top-level so it can run in the process pool)."""
+    return pwd_context.hash(password)
+
+
+def _verify_and_update_password(password: str, hashed_password: str):
+    """Verify a password (top-level so it can run in the process pool)."""
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+async def _run_bcrypt(fn, *args):
+    """Run a bcrypt operation in the process pool without blocking the event loop."""
+    if _bcrypt_slots.locked():
+        raise PasswordHashingBusy("Too many pending password hashes")
+    async with _bcrypt_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_bcrypt_pool(), fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the process pool without blocking the event loop."""
+    return await _run_bcrypt(_hash_password, password)
+
+
+def create_access_token(username: str) -> str:
+    """Create a signed access token for an authenticated user."""
+    expires_at = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+    return jwt.encode(
+        {"sub": username, "exp": expires_at}, settings.secret_key, algorithm=settings.jwt_algorithm
+    )
+
+
+def shutdown_password_hashing():
+    """Stop the password hashing process pool."""
+    if _bcrypt_pool is not None:
+        _bcrypt_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Relationships rendered by the response schemas. AsyncSession cannot lazy-load,
+# so every query whose result is serialized with them must load them up front.
+_MENU_ITEM_LOAD_OPTIONS = (
+    selectinload(MenuItem.restaurant),
+    selectinload(MenuItem.category),
+)
+# Many-to-one edges are joined into the parent SELECT; the order_items collection
+# is fetched with one extra IN query, so a page of orders costs a fixed number of
+# round trips however many orders it holds.
+_ORDER_LOAD_OPTIONS = (
+    joinedload(Order.user),
+    joinedload(Order.restaurant),
+    selectinload(Order.order_items).joinedload(OrderItem.menu_item).options(
+        joinedload(MenuItem.restaurant),
+        joinedload(MenuItem.category),
+    ),
+)
+_REVIEW_LOAD_OPTIONS = (
+    selectinload(Review.user),
+    selectinload(Review.restaurant),
+)
+
+
+def _log(db: AsyncSession):
+    """Return the request-bound logger stored on the session by get_db."""
+    return db.info.get("logger", logger)
+
+
+async def _reload(db: AsyncSession, model, pk: int, options):
+    """Re-read a row together with its response relationships after a write."""
+    return await db.get(model, pk, options=options, populate_existing=True)
+
+
+async def _update_row(db: AsyncSession, model, pk: int, values: Dict[str, Any]):
+    """Apply a partial update with a single UPDATE ... RETURNING statement."""
+    # updated_at is stamped by the column's onupdate=func.now()
+    if not values:
+        return await db.get(model, pk)
+    result = await db.execute(
+        update(model).where(model.id == pk).values(**values).returning(model)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _cached_lookup(db: AsyncSession, model, attr: str, value):
+    """Look up a row by a unique column at most once per request session."""
+    cache = db.info.setdefault("_req_cache", {})
+    key = (model, attr, value)
+    if key not in cache:
+        result = await db.scalars(select(model).where(getattr(model, attr) == value))
+        cache[key] = result.one_or_none()
+    return cache[key]
+
+
+def _invalidate_cached_lookups(db: AsyncSession, model):
+    """Drop cached lookups for a model after one of its rows changes."""
+    cache = db.info.get("_req_cache")
+    if cache:
+        for key in [key for key in cache if key[0] is model]:
+            del cache[key]
+
 
 # User CRUD operations
-def create_user(db: Session, user: UserCreate) -> User:
-    """Create a new user."""
+async def create_user(db: AsyncSession, user: UserCreate) -> User:
+    """Create a new user, hashing the password off the event loop."""
+    hashed_password = await hash_password_async(user.password)
     try:
-        from passlib.context import CryptContext
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        
-        hashed_password = pwd_context.hash(user.password)
         db_user = User(
             email=user.email,
             username=user.username,
@@ -33,271 +160,326 @@ def create_user(db: Session, user: UserCreate) -> User:
             phone=user.phone
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        _invalidate_cached_lookups(db, User)
         
-        logger.info("User created successfully", user_id=db_user.id, username=user.username)
+        _log(db).info("User created successfully", user_id=db_user.id, username=user.username)
         return db_user
     except Exception as e:
-        logger.error("Failed to create user", error=str(e), username=user.username)
-        db.rollback()
+        _log(db).error("Failed to create user", error=str(e), username=user.username)
+        await db.rollback()
         raise
 
 
-def get_user(db: Session, user_id: int) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """Verify user credentials, rehashing passwords stored with outdated settings."""
+    db_user = await get_user_by_username(db, username)
+    if db_user is None:
+        return None
+    
+    valid, new_hash = await _run_bcrypt(
+        _verify_and_update_password, password, db_user.hashed_password
+    )
+    if not valid:
+        return None
+    
+    if new_hash:
+        try:
+            db_user.hashed_password = new_hash
+            await db.commit()
+            _log(db).info("User password rehashed", user_id=db_user.id)
+        except Exception as e:
+            _log(db).error("Failed to rehash user password", error=str(e), user_id=db_user.id)
+            await db.rollback()
+    return db_user
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
     """Get user by ID."""
-    return db.query(User).filter(User.id == user_id).first()
+    return await db.get(User, user_id)
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """Get user by email."""
-    return db.query(User).filter(User.email == email).first()
+    return await _cached_lookup(db, User, "email", email)
 
 
-def get_user_by_username(db: Session, username: str) -> Optional[User]:
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
     """Get user by username."""
-    return db.query(User).filter(User.username == username).first()
+    return await _cached_lookup(db, User, "username", username)
+
+
+async def find_user_conflict(db: AsyncSession, email: str, username: str) -> Optional[str]:
+    """Return "email" or "username" if either is already in use, in one query."""
+    result = await db.execute(
+        select(User.email, User.username)
+        .where(or_(User.email == email, User.username == username))
+        .limit(1)
+    )
+    existing = result.first()
+    if existing is None:
+        return None
+    return "email" if existing.email == email else "username"
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
     """Get all users with pagination."""
-    return db.query(User).offset(skip).limit(limit).all()
+    result = await db.scalars(select(User).offset(skip).limit(limit))
+    return result.all()
 
 
-def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[User]:
+async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate) -> Optional[User]:
     """Update user information."""
     try:
-        db_user = db.query(User).filter(User.id == user_id).first()
+        update_data = user_update.dict(exclude_unset=True)
+        db_user = await _update_row(db, User, user_id, update_data)
         if db_user:
-            update_data = user_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_user, field, value)
-            db_user.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(db_user)
+            await db.commit()
+            _invalidate_cached_lookups(db, User)
             
-            logger.info("User updated successfully", user_id=user_id)
+            _log(db).info("User updated successfully", user_id=user_id)
             return db_user
         return None
     except Exception as e:
-        logger.error("Failed to update user", error=str(e), user_id=user_id)
-        db.rollback()
+        _log(db).error("Failed to update user", error=str(e), user_id=user_id)
+        await db.rollback()
         raise
 
 
-def delete_user(db: Session, user_id: int) -> bool:
+async def delete_user(db: AsyncSession, user_id: int) -> bool:
     """Delete user."""
     try:
-        db_user = db.query(User).filter(User.id == user_id).first()
+        db_user = await db.get(User, user_id)
         if db_user:
-            db.delete(db_user)
-            db.commit()
-            logger.info("User deleted successfully", user_id=user_id)
+            await db.delete(db_user)
+            await db.commit()
+            _invalidate_cached_lookups(db, User)
+            _log(db).info("User deleted successfully", user_id=user_id)
             return True
         return False
     except Exception as e:
-        logger.error("Failed to delete user", error=str(e), user_id=user_id)
-        db.rollback()
+        _log(db).error("Failed to delete user", error=str(e), user_id=user_id)
+        await db.rollback()
         raise
 
 
 # Restaurant CRUD operations
-def create_restaurant(db: Session, restaurant: RestaurantCreate) -> Restaurant:
+async def create_restaurant(db: AsyncSession, restaurant: RestaurantCreate) -> Restaurant:
     """Create a new restaurant."""
     try:
         db_restaurant = Restaurant(**restaurant.dict())
         db.add(db_restaurant)
-        db.commit()
-        db.refresh(db_restaurant)
+        await db.commit()
         
-        logger.info("Restaurant created successfully", restaurant_id=db_restaurant.id, name=restaurant.name)
+        _log(db).info("Restaurant created successfully", restaurant_id=db_restaurant.id, name=restaurant.name)
         return db_restaurant
     except Exception as e:
-        logger.error("Failed to create restaurant", error=str(e), name=restaurant.name)
-        db.rollback()
+        _log(db).error("Failed to create restaurant", error=str(e), name=restaurant.name)
+        await db.rollback()
         raise
 
 
-def get_restaurant(db: Session, restaurant_id: int) -> Optional[Restaurant]:
+async def get_restaurant(db: AsyncSession, restaurant_id: int) -> Optional[Restaurant]:
     """Get restaurant by ID."""
-    return db.query(Restaurant).filter(Restaurant.id == restaurant_id).first()
+    return await db.get(Restaurant, restaurant_id)
 
 
-def get_restaurants(db: Session, skip: int = 0, limit: int = 100, cuisine_type: Optional[str] = None) -> List[Restaurant]:
-    """Get restaurants with optional filtering."""
-    query = db.query(Restaurant).filter(Restaurant.is_active == True)
+async def get_restaurants(db: AsyncSession, skip: int = 0, limit: int = 100, cuisine_type: Optional[str] = None) -> List[Row]:
+    """Get restaurant listing rows (id, name, cuisine, rating, fee) with optional filtering."""
+    query = select(
+        Restaurant.id, Restaurant.name, Restaurant.cuisine_type,
+        Restaurant.rating, Restaurant.delivery_fee,
+    )
     
     if cuisine_type:
-        query = query.filter(Restaurant.cuisine_type == cuisine_type)
+        query = query.where(Restaurant.cuisine_type == cuisine_type)
     
-    return query.offset(skip).limit(limit).all()
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.all()
 
 
-def update_restaurant(db: Session, restaurant_id: int, restaurant_update: RestaurantUpdate) -> Optional[Restaurant]:
+async def update_restaurant(db: AsyncSession, restaurant_id: int, restaurant_update: RestaurantUpdate) -> Optional[Restaurant]:
     """Update restaurant information."""
     try:
-        db_restaurant = db.query(Restaurant).filter(Restaurant.id == restaurant_id).first()
+        update_data = restaurant_update.dict(exclude_unset=True)
+        db_restaurant = await _update_row(db, Restaurant, restaurant_id, update_data)
         if db_restaurant:
-            update_data = restaurant_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_restaurant, field, value)
-            db_restaurant.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(db_restaurant)
+            await db.commit()
             
-            logger.info("Restaurant updated successfully", restaurant_id=restaurant_id)
+            _log(db).info("Restaurant updated successfully", restaurant_id=restaurant_id)
             return db_restaurant
         return None
     except Exception as e:
-        logger.error("Failed to update restaurant", error=str(e), restaurant_id=restaurant_id)
-        db.rollback()
+        _log(db).error("Failed to update restaurant", error=str(e), restaurant_id=restaurant_id)
+        await db.rollback()
         raise
 
 
-def delete_restaurant(db: Session, restaurant_id: int) -> bool:
+async def delete_restaurant(db: AsyncSession, restaurant_id: int) -> bool:
     """Delete restaurant (soft delete)."""
     try:
-        db_restaurant = db.query(Restaurant).filter(Restaurant.id == restaurant_id).first()
+        db_restaurant = await db.get(Restaurant, restaurant_id)
         if db_restaurant:
             db_restaurant.is_active = False
-            db_restaurant.updated_at = datetime.utcnow()
-            db.commit()
+            await db.commit()
             
-            logger.info("Restaurant deleted successfully", restaurant_id=restaurant_id)
+            _log(db).info("Restaurant deleted successfully", restaurant_id=restaurant_id)
             return True
         return False
     except Exception as e:
-        logger.error("Failed to delete restaurant", error=str(e), restaurant_id=restaurant_id)
-        db.rollback()
+        _log(db).error("Failed to delete restaurant", error=str(e), restaurant_id=restaurant_id)
+        await db.rollback()
         raise
 
 
 # Category CRUD operations
-def create_category(db: Session, category: CategoryCreate) -> Category:
+async def create_category(db: AsyncSession, category: CategoryCreate) -> Category:
     """Create a new category."""
     try:
         db_category = Category(**category.dict())
         db.add(db_category)
-        db.commit()
-        db.refresh(db_category)
+        await db.commit()
         
-        logger.info("Category created successfully", category_id=db_category.id, name=category.name)
+        _log(db).info("Category created successfully", category_id=db_category.id, name=category.name)
         return db_category
     except Exception as e:
-        logger.error("Failed to create category", error=str(e), name=category.name)
-        db.rollback()
+        _log(db).error("Failed to create category", error=str(e), name=category.name)
+        await db.rollback()
         raise
 
 
-def get_category(db: Session, category_id: int) -> Optional[Category]:
+async def get_category(db: AsyncSession, category_id: int) -> Optional[Category]:
     """Get category by ID."""
-    return db.query(Category).filter(Category.id == category_id).first()
+    return await db.get(Category, category_id)
 
 
-def get_categories(db: Session, skip: int = 0, limit: int = 100) -> List[Category]:
+async def get_categories(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Category]:
     """Get all categories."""
-    return db.query(Category).filter(Category.is_active == True).offset(skip).limit(limit).all()
+    result = await db.scalars(
+        select(Category).offset(skip).limit(limit)
+    )
+    return result.all()
 
 
-def update_category(db: Session, category_id: int, category_update: CategoryUpdate) -> Optional[Category]:
+async def update_category(db: AsyncSession, category_id: int, category_update: CategoryUpdate) -> Optional[Category]:
     """Update category information."""
     try:
-        db_category = db.query(Category).filter(Category.id == category_id).first()
+        update_data = category_update.dict(exclude_unset=True)
+        db_category = await _update_row(db, Category, category_id, update_data)
         if db_category:
-            update_data = category_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_category, field, value)
-            db.commit()
-            db.refresh(db_category)
+            await db.commit()
             
-            logger.info("Category updated successfully", category_id=category_id)
+            _log(db).info("Category updated successfully", category_id=category_id)
             return db_category
         return None
     except Exception as e:
-        logger.error("Failed to update category", error=str(e), category_id=category_id)
-        db.rollback()
+        _log(db).error("Failed to update category", error=str(e), category_id=category_id)
+        await db.rollback()
         raise
 
 
 # MenuItem CRUD operations
-def create_menu_item(db: Session, menu_item: MenuItemCreate) -> MenuItem:
+async def create_menu_item(db: AsyncSession, menu_item: MenuItemCreate) -> MenuItem:
     """Create a new menu item."""
     try:
         db_menu_item = MenuItem(**menu_item.dict())
         db.add(db_menu_item)
-        db.commit()
-        db.refresh(db_menu_item)
+        await db.commit()
+        db_menu_item = await _reload(db, MenuItem, db_menu_item.id, _MENU_ITEM_LOAD_OPTIONS)
         
-        logger.info("Menu item created successfully", menu_item_id=db_menu_item.id, name=menu_item.name)
+        _log(db).info("Menu item created successfully", menu_item_id=db_menu_item.id, name=menu_item.name)
         return db_menu_item
     except Exception as e:
-        logger.error("Failed to create menu item", error=str(e), name=menu_item.name)
-        db.rollback()
+        _log(db).error("Failed to create menu item", error=str(e), name=menu_item.name)
+        await db.rollback()
         raise
 
 
-def get_menu_item(db: Session, menu_item_id: int) -> Optional[MenuItem]:
+async def get_menu_item(db: AsyncSession, menu_item_id: int) -> Optional[MenuItem]:
     """Get menu item by ID."""
-    return db.query(MenuItem).filter(MenuItem.id == menu_item_id).first()
+    return await db.get(MenuItem, menu_item_id, options=_MENU_ITEM_LOAD_OPTIONS)
 
 
-def get_menu_items_by_restaurant(db: Session, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[MenuItem]:
+async def get_menu_items_by_restaurant(db: AsyncSession, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[MenuItem]:
     """Get menu items for a specific restaurant."""
-    return db.query(MenuItem).filter(
-        MenuItem.restaurant_id == restaurant_id,
-        MenuItem.is_available == True
-    ).offset(skip).limit(limit).all()
+    result = await db.scalars(
+        select(MenuItem).options(*_MENU_ITEM_LOAD_OPTIONS)
+        .where(MenuItem.restaurant_id == restaurant_id).offset(skip).limit(limit)
+    )
+    return result.all()
+
+
+async def get_menu_item_summaries(db: AsyncSession, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[Row]:
+    """Get menu listing rows for a restaurant without descriptions or nested objects."""
+    result = await db.execute(
+        select(
+            MenuItem.id, MenuItem.name, MenuItem.price,
+            MenuItem.preparation_time, MenuItem.category_id,
+        )
+        .where(MenuItem.restaurant_id == restaurant_id).offset(skip).limit(limit)
+    )
+    return result.all()
 
 
-def update_menu_item(db: Session, menu_item_id: int, menu_item_update: MenuItemUpdate) -> Optional[MenuItem]:
+async def update_menu_item(db: AsyncSession, menu_item_id: int, menu_item_update: MenuItemUpdate) -> Optional[MenuItem]:
     """Update menu item information."""
     try:
-        db_menu_item = db.query(MenuItem).filter(MenuItem.id == menu_item_id).first()
+        update_data = menu_item_update.dict(exclude_unset=True)
+        db_menu_item = await _update_row(db, MenuItem, menu_item_id, update_data)
         if db_menu_item:
-            update_data = menu_item_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_menu_item, field, value)
-            db_menu_item.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(db_menu_item)
+            await db.commit()
+            db_menu_item = await _reload(db, MenuItem, db_menu_item.id, _MENU_ITEM_LOAD_OPTIONS)
             
-            logger.info("Menu item updated successfully", menu_item_id=menu_item_id)
+            _log(db).info("Menu item updated successfully", menu_item_id=menu_item_id)
             return db_menu_item
         return None
     except Exception as e:
-        logger.error("Failed to update menu item", error=str(e), menu_item_id=menu_item_id)
-        db.rollback()
+        _log(db).error("Failed to update menu item", error=str(e), menu_item_id=menu_item_id)
+        await db.rollback()
         raise
 
 
-def delete_menu_item(db: Session, menu_item_id: int) -> bool:
+async def delete_menu_item(db: AsyncSession, menu_item_id: int) -> bool:
     """Delete menu item (soft delete)."""
     try:
-        db_menu_item = db.query(MenuItem).filter(MenuItem.id == menu_item_id).first()
+        db_menu_item = await db.get(MenuItem, menu_item_id)
         if db_menu_item:
             db_menu_item.is_available = False
-            db_menu_item.updated_at = datetime.utcnow()
-            db.commit()
+            await db.commit()
             
-            logger.info("Menu item deleted successfully", menu_item_id=menu_item_id)
+            _log(db).info("Menu item deleted successfully", menu_item_id=menu_item_id)
             return True
         return False
     except Exception as e:
-        logger.error("Failed to delete menu item", error=str(e), menu_item_id=menu_item_id)
-        db.rollback()
+        _log(db).error("Failed to delete menu item", error=str(e), menu_item_id=menu_item_id)
+        await db.rollback()
         raise
 
 
 # Order CRUD operations
-def create_order(db: Session, order: OrderCreate, user_id: int) -> Order:
+async def create_order(db: AsyncSession, order: OrderCreate, user_id: int) -> Order:
     """Create a new order."""
     try:
-        # Calculate total amount
-        total_amount = 0
-        for item in order.order_items:
-            menu_item = get_menu_item(db, item.menu_item_id)
-            if menu_item:
-                total_amount += menu_item.price * item.quantity
+        # Fetch all referenced menu item prices in a single query
+        menu_item_ids = {item.menu_item_id for item in order.order_items}
+        result = await db.execute(
+            select(MenuItem.id, MenuItem.price).where(MenuItem.id.in_(menu_item_ids))
+        )
+        prices = dict(result.all())
+        
+        # Price every line once; the order total is the sum of the line totals
+        order_item_rows = [
+            {
+                "menu_item_id": item.menu_item_id,
+                "quantity": item.quantity,
+                "unit_price": prices[item.menu_item_id],
+                "total_price": prices[item.menu_item_id] * item.quantity,
+                "special_instructions": item.special_instructions,
+            }
+            for item in order.order_items
+            if item.menu_item_id in prices
+        ]
+        total_amount = sum(row["total_price"] for row in order_item_rows)
         
         # Create order
         db_order = Order(
@@ -308,71 +490,93 @@ def create_order(db: Session, order: OrderCreate, user_id: int) -> Order:
             delivery_instructions=order.delivery_instructions
         )
         db.add(db_order)
-        db.flush()  # Get the order ID
+        await db.flush()  # Get the order ID
         
         # Create order items
-        for item in order.order_items:
-            menu_item = get_menu_item(db, item.menu_item_id)
-            if menu_item:
-                db_order_item = OrderItem(
-                    order_id=db_order.id,
-                    menu_item_id=item.menu_item_id,
-                    quantity=item.quantity,
-                    unit_price=menu_item.price,
-                    total_price=menu_item.price * item.quantity,
-                    special_instructions=item.special_instructions
-                )
-                db.add(db_order_item)
+        for row in order_item_rows:
+            row["order_id"] = db_order.id
+        if order_item_rows:
+            await db.execute(insert(OrderItem), order_item_rows)
         
-        db.commit()
-        db.refresh(db_order)
+        await db.commit()
+        db_order = await _reload(db, Order, db_order.id, _ORDER_LOAD_OPTIONS)
         
-        logger.info("Order created successfully", order_id=db_order.id, user_id=user_id)
+        _log(db).info("Order created successfully", order_id=db_order.id, user_id=user_id)
         return db_order
     except Exception as e:
-        logger.error("Failed to create order", error=str(e), user_id=user_id)
-        db.rollback()
+        _log(db).error("Failed to create order", error=str(e), user_id=user_id)
+        await db.rollback()
         raise
 
 
-def get_order(db: Session, order_id: int) -> Optional[Order]:
+async def get_order(db: AsyncSession, order_id: int) -> Optional[Order]:
     """Get order by ID."""
-    return db.query(Order).filter(Order.id == order_id).first()
+    return await db.get(Order, order_id, options=_ORDER_LOAD_OPTIONS)
 
 
-def get_user_orders(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
+async def get_user_orders(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
     """Get orders for a specific user."""
-    return db.query(Order).filter(Order.user_id == user_id).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
+    result = await db.scalars(
+        select(Order).options(*_ORDER_LOAD_OPTIONS).where(Order.user_id == user_id)
+        .order_by(Order.created_at.desc()).offset(skip).limit(limit)
+    )
+    return result.all()
 
 
-def get_restaurant_orders(db: Session, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
+async def get_restaurant_orders(db: AsyncSession, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
     """Get orders for a specific restaurant."""
-    return db.query(Order).filter(Order.restaurant_id == restaurant_id).order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
-
-
-def update_order(db: Session, order_id: int, order_update: OrderUpdate) -> Optional[Order]:
+    result = await db.scalars(
+        select(Order).options(*_ORDER_LOAD_OPTIONS).where(Order.restaurant_id == restaurant_id)
+        .order_by(Order.created_at.desc()).offset(skip).limit(limit)
+    )
+    return result.all()
+
+
+async def iter_restaurant_orders(
+    db: AsyncSession, restaurant_id: int, batch_size: int = 500
+) -> AsyncIterator[Order]:
+    """Stream all orders for a restaurant, holding one batch in memory at a time."""
+    result = await db.stream_scalars(
+        select(Order).options(*_ORDER_LOAD_OPTIONS).where(Order.restaurant_id == restaurant_id)
+        .order_by(Order.created_at.desc()).execution_options(yield_per=batch_size)
+    )
+    async for db_order in result:
+        yield db_order
+
+
+async def iter_user_orders(
+    db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100, batch_size: int = 50
+) -> AsyncIterator[Order]:
+    """Stream a page of a user's orders through a server-side cursor."""
+    result = await db.stream_scalars(
+        select(Order).options(*_ORDER_LOAD_OPTIONS).where(Order.user_id == user_id)
+        .order_by(Order.created_at.desc()).offset(skip).limit(limit)
+        .execution_options(yield_per=batch_size)
+    )
+    async for db_order in result:
+        yield db_order
+
+
+async def update_order(db: AsyncSession, order_id: int, order_update: OrderUpdate) -> Optional[Order]:
     """Update order information."""
     try:
-        db_order = db.query(Order).filter(Order.id == order_id).first()
+        update_data = order_update.dict(exclude_unset=True)
+        db_order = await _update_row(db, Order, order_id, update_data)
         if db_order:
-            update_data = order_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_order, field, value)
-            db_order.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(db_order)
+            await db.commit()
+            db_order = await _reload(db, Order, db_order.id, _ORDER_LOAD_OPTIONS)
             
-            logger.info("Order updated successfully", order_id=order_id)
+            _log(db).info("Order updated successfully", order_id=order_id)
             return db_order
         return None
     except Exception as e:
-        logger.error("Failed to update order", error=str(e), order_id=order_id)
-        db.rollback()
+        _log(db).error("Failed to update order", error=str(e), order_id=order_id)
+        await db.rollback()
         raise
 
 
 # Review CRUD operations
-def create_review(db: Session, review: ReviewCreate, user_id: int) -> Review:
+async def create_review(db: AsyncSession, review: ReviewCreate, user_id: int) -> Review:
     """Create a new review."""
     try:
         db_review = Review(
@@ -383,138 +587,161 @@ def create_review(db: Session, review: ReviewCreate, user_id: int) -> Review:
             comment=review.comment
         )
         db.add(db_review)
-        db.commit()
-        db.refresh(db_review)
+        await db.commit()
+        db_review = await _reload(db, Review, db_review.id, _REVIEW_LOAD_OPTIONS)
         
-        logger.info("Review created successfully", review_id=db_review.id, user_id=user_id)
+        _log(db).info("Review created successfully", review_id=db_review.id, user_id=user_id)
         return db_review
     except Exception as e:
-        logger.error("Failed to create review", error=str(e), user_id=user_id)
-        db.rollback()
+        _log(db).error("Failed to create review", error=str(e), user_id=user_id)
+        await db.rollback()
         raise
 
 
-def get_review(db: Session, review_id: int) -> Optional[Review]:
+async def get_review(db: AsyncSession, review_id: int) -> Optional[Review]:
     """Get review by ID."""
-    return db.query(Review).filter(Review.id == review_id).first()
+    return await db.get(Review, review_id, options=_REVIEW_LOAD_OPTIONS)
 
 
-def get_restaurant_reviews(db: Session, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
+async def get_restaurant_reviews(db: AsyncSession, restaurant_id: int, skip: int = 0, limit: int = 100) -> List[Review]:
     """Get reviews for a specific restaurant."""
-    return db.query(Review).filter(Review.restaurant_id == restaurant_id).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
+    result = await db.scalars(
+        select(Review).options(*_REVIEW_LOAD_OPTIONS).where(Review.restaurant_id == restaurant_id)
+        .order_by(Review.created_at.desc()).offset(skip).limit(limit)
+    )
+    return result.all()
 
 
-def update_review(db: Session, review_id: int, review_update: ReviewUpdate) -> Optional[Review]:
+async def update_review(db: AsyncSession, review_id: int, review_update: ReviewUpdate) -> Optional[Review]:
     """Update review information."""
     try:
-        db_review = db.query(Review).filter(Review.id == review_id).first()
+        update_data = review_update.dict(exclude_unset=True)
+        db_review = await _update_row(db, Review, review_id, update_data)
         if db_review:
-            update_data = review_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_review, field, value)
-            db.commit()
-            db.refresh(db_review)
+            await db.commit()
+            db_review = await _reload(db, Review, db_review.id, _REVIEW_LOAD_OPTIONS)
             
-            logger.info("Review updated successfully", review_id=review_id)
+            _log(db).info("Review updated successfully", review_id=review_id)
             return db_review
         return None
     except Exception as e:
-        logger.error("Failed to update review", error=str(e), review_id=review_id)
-        db.rollback()
+        _log(db).error("Failed to update review", error=str(e), review_id=review_id)
+        await db.rollback()
         raise
 
 
 # Delivery Driver CRUD operations
-def create_delivery_driver(db: Session, driver: DeliveryDriverCreate) -> DeliveryDriver:
+async def create_delivery_driver(db: AsyncSession, driver: DeliveryDriverCreate) -> DeliveryDriver:
     """Create a new delivery driver."""
     try:
         db_driver = DeliveryDriver(**driver.dict())
         db.add(db_driver)
-        db.commit()
-        db.refresh(db_driver)
+        await db.commit()
         
-        logger.info("Delivery driver created successfully", driver_id=db_driver.id, name=driver.name)
+        _log(db).info("Delivery driver created successfully", driver_id=db_driver.id, name=driver.name)
         return db_driver
     except Exception as e:
-        logger.error("Failed to create delivery driver", error=str(e), name=driver.name)
-        db.rollback()
+        _log(db).error("Failed to create delivery driver", error=str(e), name=driver.name)
+        await db.rollback()
         raise
 
 
-def get_delivery_driver(db: Session, driver_id: int) -> Optional[DeliveryDriver]:
+async def get_delivery_driver(db: AsyncSession, driver_id: int) -> Optional[DeliveryDriver]:
     """Get delivery driver by ID."""
-    return db.query(DeliveryDriver).filter(DeliveryDriver.id == driver_id).first()
+    return await db.get(DeliveryDriver, driver_id)
 
 
-def get_available_drivers(db: Session) -> List[DeliveryDriver]:
+async def get_available_drivers(db: AsyncSession) -> List[DeliveryDriver]:
     """Get all available delivery drivers."""
-    return db.query(DeliveryDriver).filter(DeliveryDriver.is_available == True).all()
+    result = await db.scalars(select(DeliveryDriver).where(DeliveryDriver.is_available.is_(True)))
+    return result.all()
 
 
-def update_delivery_driver(db: Session, driver_id: int, driver_update: DeliveryDriverUpdate) -> Optional[DeliveryDriver]:
+async def update_delivery_driver(db: AsyncSession, driver_id: int, driver_update: DeliveryDriverUpdate) -> Optional[DeliveryDriver]:
     """Update delivery driver information."""
     try:
-        db_driver = db.query(DeliveryDriver).filter(DeliveryDriver.id == driver_id).first()
+        update_data = driver_update.dict(exclude_unset=True)
+        db_driver = await _update_row(db, DeliveryDriver, driver_id, update_data)
         if db_driver:
-            update_data = driver_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_driver, field, value)
-            db_driver.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(db_driver)
+            await db.commit()
             
-            logger.info("Delivery driver updated successfully", driver_id=driver_id)
+            _log(db).info("Delivery driver updated successfully", driver_id=driver_id)
             return db_driver
         return None
     except Exception as e:
-        logger.error("Failed to update delivery driver", error=str(e), driver_id=driver_id)
-        db.rollback()
+        _log(db).error("Failed to update delivery driver", error=str(e), driver_id=driver_id)
+        await db.rollback()
         raise
 
 
 # Delivery CRUD operations
-def create_delivery(db: Session, delivery: DeliveryCreate) -> Delivery:
+async def create_delivery(db: AsyncSession, delivery: DeliveryCreate) -> Delivery:
     """Create a new delivery."""
     try:
         db_delivery = Delivery(**delivery.dict())
         db.add(db_delivery)
-        db.commit()
-        db.refresh(db_delivery)
+        await db.commit()
         
-        logger.info("Delivery created successfully", delivery_id=db_delivery.id, order_id=delivery.order_id)
+        _log(db).info("Delivery created successfully", delivery_id=db_delivery.id, order_id=delivery.order_id)
         return db_delivery
     except Exception as e:
-        logger.error("Failed to create delivery", error=str(e), order_id=delivery.order_id)
-        db.rollback()
+        _log(db).error("Failed to create delivery", error=str(e), order_id=delivery.order_id)
+        await db.rollback()
         raise
 
 
-def get_delivery(db: Session, delivery_id: int) -> Optional[Delivery]:
+async def get_delivery(db: AsyncSession, delivery_id: int) -> Optional[Delivery]:
     """Get delivery by ID."""
-    return db.query(Delivery).filter(Delivery.id == delivery_id).first()
+    return await db.get(Delivery, delivery_id)
 
 
-def get_order_delivery(db: Session, order_id: int) -> Optional[Delivery]:
+async def get_order_delivery(db: AsyncSession, order_id: int) -> Optional[Delivery]:
     """Get delivery for a specific order."""
-    return db.query(Delivery).filter(Delivery.order_id == order_id).first()
+    result = await db.execute(select(Delivery).where(Delivery.order_id == order_id))
+    return result.scalars().first()
 
 
-def update_delivery(db: Session, delivery_id: int, delivery_update: DeliveryUpdate) -> Optional[Delivery]:
+async def update_delivery(db: AsyncSession, delivery_id: int, delivery_update: DeliveryUpdate) -> Optional[Delivery]:
     """Update delivery information."""
     try:
-        db_delivery = db.query(Delivery).filter(Delivery.id == delivery_id).first()
+        update_data = delivery_update.dict(exclude_unset=True)
+        db_delivery = await _update_row(db, Delivery, delivery_id, update_data)
         if db_delivery:
-            update_data = delivery_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_delivery, field, value)
-            db_delivery.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(db_delivery)
+            await db.commit()
             
-            logger.info("Delivery updated successfully", delivery_id=delivery_id)
+            _log(db).info("Delivery updated successfully", delivery_id=delivery_id)
             return db_delivery
         return None
     except Exception as e:
-        logger.error("Failed to update delivery", error=str(e), delivery_id=delivery_id)
-        db.rollback()
-        raise 
\ No newline at end of file
+        _log(db).error("Failed to update delivery", error=str(e), delivery_id=delivery_id)
+        await db.rollback()
+        raise
+
+
+# Statement cache warm-up
+async def warm_statement_cache(db: AsyncSession):
+    """Run the hot read paths once so their compiled SQL is cached before traffic.
+
+    SQLAlchemy's compiled cache is per process, so each worker pays compilation on
+    its first requests. Probing with an id that cannot exist compiles every statement
+    (LIMIT/OFFSET are bound parameters, so the cache keys match real requests).
+    """
+    missing_id = -1
+    await get_user(db, missing_id)
+    await get_user_by_email(db, "")
+    await get_user_by_username(db, "")
+    await find_user_conflict(db, "", "")
+    await get_users(db, limit=1)
+    await get_restaurant(db, missing_id)
+    await get_restaurants(db, limit=1)
+    await get_categories(db, limit=1)
+    await get_menu_item(db, missing_id)
+    await get_menu_items_by_restaurant(db, missing_id, limit=1)
+    await get_menu_item_summaries(db, missing_id, limit=1)
+    await get_order(db, missing_id)
+    await get_user_orders(db, missing_id, limit=1)
+    await get_restaurant_orders(db, missing_id, limit=1)
+    await get_review(db, missing_id)
+    await get_restaurant_reviews(db, missing_id, limit=1)
+    await get_available_drivers(db)
+    await db.rollback()
@@ -1,30 +1,66 @@
-from sqlalchemy import create_engine, MetaData
+from fastapi import Request
+from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
-from config import settings, get_database_url
+from config import settings, get_database_url, get_async_database_url
+from contextlib import contextmanager
+from typing import AsyncGenerator, Iterator
 import structlog
+import uuid
 
 logger = structlog.get_logger()
 
 # Database URL with SSL for cloud databases
 DATABASE_URL = get_database_url()
 
-# Engine configuration with connection pooling
+# Engine configuration with connection pooling. Only Celery tasks and schema
+# management use it, so the pool is capped at one connection per worker thread.
 engine = create_engine(
     DATABASE_URL,
     poolclass=QueuePool,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
+    pool_size=settings.worker_concurrency,
+    max_overflow=0,
     pool_timeout=settings.db_pool_timeout,
     pool_recycle=settings.db_pool_recycle,
     pool_pre_ping=True,  # Verify connections before use
+    query_cache_size=settings.sa_query_cache_size,  # Compiled statement cache
     echo=settings.debug,  # SQL logging in debug mode
 )
 
-# Session factory
+# Session factory (Celery tasks and schema management)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the API, using the asyncpg driver
+async_engine = create_async_engine(
+    get_async_database_url(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,  # Reuse warm connections; idle ones age out via pool_recycle
+    pool_pre_ping=True,  # Recover from cloud-DB failovers without a burst of errors
+    query_cache_size=settings.sa_query_cache_size,
+    echo=settings.debug,
+    connect_args={
+        "server_settings": {"statement_timeout": str(settings.db_statement_timeout_ms)}
+    },
+)
+
+
+class ApiSession(Session):
+    """Session class behind the API's async sessions (see models for its soft-delete filter)."""
+
+
+# Async session factory
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, expire_on_commit=False, sync_session_class=ApiSession
+)
+
+# Connection probe, built once and reused by the health checks
+_PING = text("SELECT 1")
+
 # Base class for models
 Base = declarative_base()
 
@@ -32,13 +68,27 @@ Base = declarative_base()
 metadata = MetaData()
 
 
-def get_db():
-    """Dependency to get database session."""
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get database session, with a logger bound to the request."""
+    async with AsyncSessionLocal() as db:
+        request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+        db.info["logger"] = logger.bind(request_id=request_id)
+        try:
+            yield db
+        except Exception as e:
+            logger.error("Database session error", error=str(e))
+            await db.rollback()
+            raise
+
+
+@contextmanager
+def task_session() -> Iterator[Session]:
+    """Session scope for a Celery task: commit on success, roll back on error, always close."""
     db = SessionLocal()
     try:
         yield db
-    except Exception as e:
-        logger.error("Database session error", error=str(e))
+        db.commit()
+    except Exception:
         db.rollback()
         raise
     finally:
@@ -50,6 +100,11 @@ def init_db():
     try:
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
+        logger.info(
+            "Database engine configured",
+            server_version=engine.dialect.server_version_info,
+            query_cache_size=settings.sa_query_cache_size,
+        )
     except Exception as e:
         logger.error("Failed to create database tables", error=str(e))
         raise
@@ -59,20 +114,32 @@ def check_db_connection():
     """Check database connection health."""
     try:
         with engine.connect() as connection:
-            connection.execute("SELECT 1")
+            connection.execute(_PING)
+        return True
+    except Exception as e:
+        logger.error("Database connection failed", error=str(e))
+        return False
+
+
+async def check_async_db_connection():
+    """Check database connection health through the API's async engine."""
+    try:
+        async with async_engine.connect() as connection:
+            await connection.execute(_PING)
         return True
     except Exception as e:
         logger.error("Database connection failed", error=str(e))
         return False
 
 
-def get_db_stats():
+def get_db_stats(db_engine=None):
     """Get database connection pool statistics."""
-    pool = engine.pool
+    pool = (db_engine or engine).pool
     return {
         "pool_size": pool.size(),
         "checked_in": pool.checkedin(),
         "checked_out": pool.checkedout(),
         "overflow": pool.overflow(),
         "invalid": pool.invalid(),
+        "status": pool.status(),
     } 
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""Gunicorn settings for the API: preload once in the master, then fork Uvicorn workers."""
+import os
+
+bind = "0.0.0.0:8000"
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app (settings, engines, compiled models) once and share it via fork
+preload_app = True
+
+
+def on_starting(server):
+    """Create tables once in the master instead of racing from every worker."""
+    from config import settings
+    from database import engine, init_db
+
+    init_db()
+    engine.dispose()
+    settings.db_create_tables_on_startup = False
+
+
+def post_fork(server, worker):
+    """Drop pooled sockets inherited from the master; each worker opens its own."""
+    from database import engine, async_engine
+    from main import log_writer
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    log_writer.after_fork()
@@ -0,0 +1,18 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+
+# Payloads passed between the API and Celery tasks. The data is produced by our
+# own code, so these are plain slotted dataclasses rather than Pydantic models:
+# no per-field validation on either side of the broker.
+@dataclass(frozen=True, slots=True)
+class OrderTaskPayload:
+    id: int
+
+    def to_message(self) -> Dict[str, Any]:
+        """JSON-serializable form for task arguments."""
+        return asdict(self)
+
+    @classmethod
+    def from_message(cls, data: Dict[str, Any]) -> "OrderTaskPayload":
+        return cls(id=data["id"])
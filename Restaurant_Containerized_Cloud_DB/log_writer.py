@@ -0,0 +1,62 @@
+import queue
+import threading
+from typing import BinaryIO
+
+
+class QueuedLogWriter:
+    """File-like sink for structlog's BytesLogger that writes on a background thread.
+
+    Request handlers only enqueue the rendered line; a single listener thread does
+    the blocking write() and flush() to the underlying stream.
+    """
+
+    _STOP = object()
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._running = False
+        self._reset()
+
+    def _reset(self):
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+
+    def start(self):
+        """Start the listener thread."""
+        self._running = True
+        self._thread.start()
+
+    def after_fork(self):
+        """Give a forked child its own queue and listener (threads do not survive fork)."""
+        self._running = False
+        self._reset()
+        self.start()
+
+    def stop(self):
+        """Write out everything still queued and stop the listener thread."""
+        if self._running:
+            self._running = False
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def write(self, data: bytes):
+        if self._running:
+            self._queue.put(data)
+        else:
+            # Before start() / after stop() there is no listener, so write inline
+            self._stream.write(data)
+            self._stream.flush()
+
+    def flush(self):
+        # Flushing happens on the listener thread once the queue drains
+        pass
+
+    def _drain(self):
+        while True:
+            data = self._queue.get()
+            if data is self._STOP:
+                break
+            self._stream.write(data)
+            if self._queue.empty():
+                self._stream.flush()
+        self._stream.flush()
@@ -1,39 +1,77 @@
-from fastapi import FastAPI, Depends, HTTPException, status, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, Request, status, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+import asyncio
+import hashlib
+import logging
+import orjson
 import structlog
+import sys
+import time
 from datetime import datetime
 
-from database import get_db, init_db, check_db_connection, get_db_stats
+from database import (
+    get_db, init_db, check_async_db_connection, get_db_stats, engine, async_engine, AsyncSessionLocal
+)
 from config import settings
 from crud import *
 from schemas import *
 from tasks import process_order, generate_analytics_report, monitor_system_health
-from redis import Redis
-from config import get_redis_url
+from internal_schemas import OrderTaskPayload
+from cache import (
+    cache_get, cache_set, cache_invalidate, cache_invalidate_prefix, redis_cache, redis_pool
+)
+from log_writer import QueuedLogWriter
+
+# Configure structured logging: orjson renders straight to bytes, bypassing the
+# stdlib logging machinery, and a background thread does the stdout writes
+log_writer = QueuedLogWriter(sys.stdout.buffer)
+log_writer.start()
 
-# Configure structured logging
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.EventRenamer("msg"),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps)
     ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(settings.log_level.upper())),
+    logger_factory=structlog.BytesLoggerFactory(file=log_writer),
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger()
+logger = structlog.get_logger().bind(module="api")
+
+def _json_response(body) -> Response:
+    """Wrap an already-serialized JSON body in a response."""
+    return Response(content=body, media_type="application/json")
+
+
+def _dump_list(adapter, model, items) -> bytes:
+    """Validate and serialize a page of rows in one pydantic-core call."""
+    if settings.skip_output_validation:
+        return adapter.dump_json([model.from_db(item) for item in items])
+    return adapter.dump_json(adapter.validate_python(items))
+
+
+def _cacheable_response(request: Request, body) -> Response:
+    """Serve a JSON body with HTTP caching headers, or 304 if the client's copy is current."""
+    if isinstance(body, str):
+        body = body.encode()
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.http_cache_max_age}, stale-while-revalidate=30",
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # Create FastAPI app
 app = FastAPI(
@@ -41,7 +79,8 @@ app = FastAPI(
     description="Containerized Restaurant Menu System with Cloud Database Integration",
     version="3.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -59,367 +98,532 @@ app.add_middleware(
 )
 
 # Health check endpoint
-@app.get("/health", response_model=HealthCheck)
-async def health_check():
-    """Health check endpoint for container orchestration."""
+# Probes arriving within HEALTH_TTL_SECONDS share one backend check
+HEALTH_TTL_SECONDS = 0.5
+_health_lock = asyncio.Lock()
+_health_cache = {"expires_at": 0.0, "result": None}
+
+
+async def _probe_health() -> HealthCheck:
+    """Check the database and Redis once."""
+    timestamp = time.time_ns() // 1_000_000
     try:
         # Check database connection
-        db_healthy = check_db_connection()
+        db_healthy = await check_async_db_connection()
         
         # Check Redis connection
-        redis_client = Redis.from_url(get_redis_url())
-        redis_healthy = redis_client.ping()
+        redis_healthy = await redis_cache.ping()
         
         return HealthCheck(
             status="healthy" if db_healthy and redis_healthy else "unhealthy",
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
             database=db_healthy,
             redis=redis_healthy,
             version="3.0.0"
         )
-    except Exception as e:
-        logger.error("Health check failed", error=str(e))
+    except Exception:
+        logger.exception("Health check failed")
         return HealthCheck(
             status="unhealthy",
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
             database=False,
             redis=False,
             version="3.0.0"
         )
 
 
+@app.get("/health", response_model=HealthCheck)
+async def health_check():
+    """Health check endpoint for container orchestration."""
+    if time.monotonic() < _health_cache["expires_at"]:
+        return _health_cache["result"]
+    
+    async with _health_lock:
+        # Another probe may have refreshed the result while we waited
+        if time.monotonic() >= _health_cache["expires_at"]:
+            _health_cache["result"] = await _probe_health()
+            _health_cache["expires_at"] = time.monotonic() + HEALTH_TTL_SECONDS
+        return _health_cache["result"]
+
+
 # System monitoring endpoints
+# Composed /metrics payload, shared by all scrapers for METRICS_TTL_SECONDS
+METRICS_TTL_SECONDS = 5.0
+_metrics_cache = {"expires_at": 0.0, "payload": None}
+
+
+async def _collect_metrics() -> dict:
+    """Gather pool stats and the few Redis INFO fields /metrics reports."""
+    db_stats = get_db_stats(async_engine)
+    
+    # Ask only for the INFO sections we read instead of the full dump
+    clients_info = await redis_cache.info(section="clients")
+    memory_info = await redis_cache.info(section="memory")
+    stats_info = await redis_cache.info(section="stats")
+    
+    return {
+        "database": db_stats,
+        "redis": {
+            "connected_clients": clients_info.get("connected_clients", 0),
+            "used_memory": memory_info.get("used_memory", 0),
+            "total_commands_processed": stats_info.get("total_commands_processed", 0)
+        },
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @app.get("/metrics")
 async def get_metrics():
     """Get system metrics for monitoring."""
     try:
-        db_stats = get_db_stats()
-        
-        # Get Redis info
-        redis_client = Redis.from_url(get_redis_url())
-        redis_info = redis_client.info()
-        
-        return {
-            "database": db_stats,
-            "redis": {
-                "connected_clients": redis_info.get("connected_clients", 0),
-                "used_memory": redis_info.get("used_memory", 0),
-                "total_commands_processed": redis_info.get("total_commands_processed", 0)
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    except Exception as e:
-        logger.error("Failed to get metrics", error=str(e))
+        now = time.monotonic()
+        if _metrics_cache["payload"] is None or now >= _metrics_cache["expires_at"]:
+            _metrics_cache["payload"] = await _collect_metrics()
+            _metrics_cache["expires_at"] = now + METRICS_TTL_SECONDS
+        return _metrics_cache["payload"]
+    except Exception:
+        logger.exception("Failed to get metrics")
         raise HTTPException(status_code=500, detail="Failed to get metrics")
 
 
 @app.post("/analytics/generate")
-async def generate_analytics(background_tasks: BackgroundTasks):
+async def generate_analytics():
     """Generate analytics report in background."""
     try:
         task = generate_analytics_report.delay()
         return {"task_id": task.id, "status": "started"}
-    except Exception as e:
-        logger.error("Failed to start analytics generation", error=str(e))
+    except Exception:
+        logger.exception("Failed to start analytics generation")
         raise HTTPException(status_code=500, detail="Failed to start analytics generation")
 
 
+# Authentication endpoints
+@app.post("/auth/login", response_model=Token)
+async def login(credentials: LoginRequest, db: AsyncSession = Depends(get_db)):
+    """Exchange username and password for an access token."""
+    try:
+        db_user = await authenticate_user(db, credentials.username, credentials.password)
+    except PasswordHashingBusy:
+        raise HTTPException(status_code=503, detail="Server busy, please retry")
+    except Exception:
+        logger.exception("Failed to authenticate user")
+        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    if db_user is None or not db_user.is_active:
+        raise HTTPException(status_code=401, detail="Incorrect username or password")
+    return Token(access_token=create_access_token(db_user.username))
+
+
 # User endpoints
 @app.post("/users/", response_model=User)
-def create_user_endpoint(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user_endpoint(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Create a new user."""
     try:
-        db_user = get_user_by_email(db, email=user.email)
-        if db_user:
+        conflict = await find_user_conflict(db, email=user.email, username=user.username)
+        if conflict == "email":
             raise HTTPException(status_code=400, detail="Email already registered")
-        
-        db_user = get_user_by_username(db, username=user.username)
-        if db_user:
+        if conflict == "username":
             raise HTTPException(status_code=400, detail="Username already taken")
         
-        return create_user(db=db, user=user)
+        return await create_user(db=db, user=user)
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to create user", error=str(e))
+    except IntegrityError:
+        # A concurrent signup took the email or username after the check
+        raise HTTPException(status_code=400, detail="Email or username already taken")
+    except PasswordHashingBusy:
+        raise HTTPException(status_code=503, detail="Server busy, please retry")
+    except Exception:
+        logger.exception("Failed to create user")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/users/", response_model=List[User])
-def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
     """Get all users."""
     try:
-        users = get_users(db, skip=skip, limit=limit)
-        return users
-    except Exception as e:
-        logger.error("Failed to get users", error=str(e))
+        users = await get_users(db, skip=skip, limit=limit)
+        return _json_response(_dump_list(user_list_adapter, User, users))
+    except Exception:
+        logger.exception("Failed to get users")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/users/{user_id}", response_model=User)
-def read_user(user_id: int, db: Session = Depends(get_db)):
+async def read_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """Get user by ID."""
     try:
-        db_user = get_user(db, user_id=user_id)
+        cache_key = f"user:{user_id}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        
+        db_user = await get_user(db, user_id=user_id)
         if db_user is None:
             raise HTTPException(status_code=404, detail="User not found")
-        return db_user
+        body = User.from_db(db_user).model_dump_json()
+        await cache_set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to get user", error=str(e), user_id=user_id)
+    except Exception:
+        logger.exception("Failed to get user", user_id=user_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Restaurant endpoints
 @app.post("/restaurants/", response_model=Restaurant)
-def create_restaurant_endpoint(restaurant: RestaurantCreate, db: Session = Depends(get_db)):
+async def create_restaurant_endpoint(restaurant: RestaurantCreate, db: AsyncSession = Depends(get_db)):
     """Create a new restaurant."""
     try:
-        return create_restaurant(db=db, restaurant=restaurant)
-    except Exception as e:
-        logger.error("Failed to create restaurant", error=str(e))
+        db_restaurant = await create_restaurant(db=db, restaurant=restaurant)
+        await cache_invalidate_prefix("restaurants:list:")
+        return db_restaurant
+    except Exception:
+        logger.exception("Failed to create restaurant")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.get("/restaurants/", response_model=List[Restaurant])
-def read_restaurants(
+@app.get("/restaurants/", response_model=List[RestaurantListItem])
+async def read_restaurants(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
     cuisine_type: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get restaurants with optional filtering."""
     try:
-        restaurants = get_restaurants(db, skip=skip, limit=limit, cuisine_type=cuisine_type)
-        return restaurants
-    except Exception as e:
-        logger.error("Failed to get restaurants", error=str(e))
+        cache_key = f"restaurants:list:{skip}:{limit}:{cuisine_type or ''}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return _cacheable_response(request, cached)
+        
+        restaurants = await get_restaurants(db, skip=skip, limit=limit, cuisine_type=cuisine_type)
+        body = _dump_list(restaurant_list_adapter, RestaurantListItem, restaurants)
+        await cache_set(cache_key, body)
+        return _cacheable_response(request, body)
+    except Exception:
+        logger.exception("Failed to get restaurants")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/restaurants/{restaurant_id}", response_model=Restaurant)
-def read_restaurant(restaurant_id: int, db: Session = Depends(get_db)):
+async def read_restaurant(restaurant_id: int, db: AsyncSession = Depends(get_db)):
     """Get restaurant by ID."""
     try:
-        db_restaurant = get_restaurant(db, restaurant_id=restaurant_id)
+        cache_key = f"restaurant:{restaurant_id}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        
+        db_restaurant = await get_restaurant(db, restaurant_id=restaurant_id)
         if db_restaurant is None:
             raise HTTPException(status_code=404, detail="Restaurant not found")
-        return db_restaurant
+        body = Restaurant.from_db(db_restaurant).model_dump_json()
+        await cache_set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to get restaurant", error=str(e), restaurant_id=restaurant_id)
+    except Exception:
+        logger.exception("Failed to get restaurant", restaurant_id=restaurant_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.put("/restaurants/{restaurant_id}", response_model=Restaurant)
-def update_restaurant_endpoint(
+async def update_restaurant_endpoint(
     restaurant_id: int, 
     restaurant: RestaurantUpdate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update restaurant information."""
     try:
-        db_restaurant = update_restaurant(db=db, restaurant_id=restaurant_id, restaurant_update=restaurant)
+        db_restaurant = await update_restaurant(db=db, restaurant_id=restaurant_id, restaurant_update=restaurant)
         if db_restaurant is None:
             raise HTTPException(status_code=404, detail="Restaurant not found")
+        await cache_invalidate(f"restaurant:{restaurant_id}")
+        await cache_invalidate_prefix("restaurants:list:")
+        await cache_invalidate_prefix(f"menu_items:restaurant:{restaurant_id}:")
+        # Single menu items embed their restaurant, and are keyed by item id alone
+        await cache_invalidate_prefix("menu_item:")
         return db_restaurant
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to update restaurant", error=str(e), restaurant_id=restaurant_id)
+    except Exception:
+        logger.exception("Failed to update restaurant", restaurant_id=restaurant_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Category endpoints
 @app.post("/categories/", response_model=Category)
-def create_category_endpoint(category: CategoryCreate, db: Session = Depends(get_db)):
+async def create_category_endpoint(category: CategoryCreate, db: AsyncSession = Depends(get_db)):
     """Create a new category."""
     try:
-        return create_category(db=db, category=category)
-    except Exception as e:
-        logger.error("Failed to create category", error=str(e))
+        db_category = await create_category(db=db, category=category)
+        await cache_invalidate_prefix("categories:list:")
+        return db_category
+    except Exception:
+        logger.exception("Failed to create category")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/categories/", response_model=List[Category])
-def read_categories(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_categories(request: Request, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
     """Get all categories."""
     try:
-        categories = get_categories(db, skip=skip, limit=limit)
-        return categories
-    except Exception as e:
-        logger.error("Failed to get categories", error=str(e))
+        cache_key = f"categories:list:{skip}:{limit}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return _cacheable_response(request, cached)
+        
+        categories = await get_categories(db, skip=skip, limit=limit)
+        body = _dump_list(category_list_adapter, Category, categories)
+        await cache_set(cache_key, body, ttl=settings.cache_ttl_categories)
+        return _cacheable_response(request, body)
+    except Exception:
+        logger.exception("Failed to get categories")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Menu item endpoints
 @app.post("/menu-items/", response_model=MenuItem)
-def create_menu_item_endpoint(menu_item: MenuItemCreate, db: Session = Depends(get_db)):
+async def create_menu_item_endpoint(menu_item: MenuItemCreate, db: AsyncSession = Depends(get_db)):
     """Create a new menu item."""
     try:
-        return create_menu_item(db=db, menu_item=menu_item)
-    except Exception as e:
-        logger.error("Failed to create menu item", error=str(e))
+        db_menu_item = await create_menu_item(db=db, menu_item=menu_item)
+        await cache_invalidate_prefix(f"menu_items:restaurant:{menu_item.restaurant_id}:")
+        return db_menu_item
+    except Exception:
+        logger.exception("Failed to create menu item")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/menu-items/restaurant/{restaurant_id}", response_model=List[MenuItem])
-def read_menu_items_by_restaurant(
+async def read_menu_items_by_restaurant(
     restaurant_id: int, 
     skip: int = 0, 
     limit: int = 100, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get menu items for a specific restaurant."""
     try:
-        menu_items = get_menu_items_by_restaurant(db, restaurant_id=restaurant_id, skip=skip, limit=limit)
-        return menu_items
-    except Exception as e:
-        logger.error("Failed to get menu items", error=str(e), restaurant_id=restaurant_id)
+        cache_key = f"menu_items:restaurant:{restaurant_id}:{skip}:{limit}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return _json_response(cached)
+        
+        menu_items = await get_menu_items_by_restaurant(db, restaurant_id=restaurant_id, skip=skip, limit=limit)
+        body = _dump_list(menu_item_list_adapter, MenuItem, menu_items)
+        await cache_set(cache_key, body, ttl=settings.cache_ttl_menu_items)
+        return _json_response(body)
+    except Exception:
+        logger.exception("Failed to get menu items", restaurant_id=restaurant_id)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@app.get("/menu-items/restaurant/{restaurant_id}/summary", response_model=List[MenuItemSummary])
+async def read_menu_item_summaries(
+    restaurant_id: int, 
+    skip: int = 0, 
+    limit: int = 100, 
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a restaurant's menu as lightweight listing rows."""
+    try:
+        cache_key = f"menu_items:restaurant:{restaurant_id}:summary:{skip}:{limit}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return _json_response(cached)
+        
+        rows = await get_menu_item_summaries(db, restaurant_id=restaurant_id, skip=skip, limit=limit)
+        body = _dump_list(menu_item_summary_list_adapter, MenuItemSummary, rows)
+        await cache_set(cache_key, body, ttl=settings.cache_ttl_menu_items)
+        return _json_response(body)
+    except Exception:
+        logger.exception("Failed to get menu item summaries", restaurant_id=restaurant_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/menu-items/{menu_item_id}", response_model=MenuItem)
-def read_menu_item(menu_item_id: int, db: Session = Depends(get_db)):
+async def read_menu_item(menu_item_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     """Get menu item by ID."""
     try:
-        db_menu_item = get_menu_item(db, menu_item_id=menu_item_id)
+        cache_key = f"menu_item:{menu_item_id}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return _cacheable_response(request, cached)
+        
+        db_menu_item = await get_menu_item(db, menu_item_id=menu_item_id)
         if db_menu_item is None:
             raise HTTPException(status_code=404, detail="Menu item not found")
-        return db_menu_item
+        body = MenuItem.from_db(db_menu_item).model_dump_json()
+        await cache_set(cache_key, body)
+        return _cacheable_response(request, body)
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to get menu item", error=str(e), menu_item_id=menu_item_id)
+    except Exception:
+        logger.exception("Failed to get menu item", menu_item_id=menu_item_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Order endpoints
 @app.post("/orders/", response_model=Order)
-def create_order_endpoint(
+async def create_order_endpoint(
     order: OrderCreate, 
     user_id: int = 1,  # In production, get from authentication
-    background_tasks: BackgroundTasks = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new order."""
     try:
-        db_order = create_order(db=db, order=order, user_id=user_id)
+        db_order = await create_order(db=db, order=order, user_id=user_id)
         
-        # Process order in background
-        if background_tasks:
-            background_tasks.add_task(process_order, {"id": db_order.id})
-        else:
-            process_order.delay({"id": db_order.id})
+        # Process order on the Celery workers, never in the API process
+        process_order.delay(OrderTaskPayload(id=db_order.id).to_message())
         
         return db_order
-    except Exception as e:
-        logger.error("Failed to create order", error=str(e))
+    except Exception:
+        logger.exception("Failed to create order")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/orders/{order_id}", response_model=Order)
-def read_order(order_id: int, db: Session = Depends(get_db)):
+async def read_order(order_id: int, db: AsyncSession = Depends(get_db)):
     """Get order by ID."""
     try:
-        db_order = get_order(db, order_id=order_id)
+        db_order = await get_order(db, order_id=order_id)
         if db_order is None:
             raise HTTPException(status_code=404, detail="Order not found")
         return db_order
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to get order", error=str(e), order_id=order_id)
+    except Exception:
+        logger.exception("Failed to get order", order_id=order_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/orders/restaurant/{restaurant_id}/export")
+async def export_restaurant_orders(restaurant_id: int):
+    """Stream every order for a restaurant as newline-delimited JSON."""
+    async def order_lines():
+        # The stream outlives the request handler, so it owns its session
+        async with AsyncSessionLocal() as db:
+            try:
+                async for db_order in iter_restaurant_orders(db, restaurant_id=restaurant_id):
+                    yield Order.from_db(db_order).model_dump_json() + "\n"
+            except Exception:
+                logger.exception("Failed to export orders", restaurant_id=restaurant_id)
+                raise
+    
+    return StreamingResponse(order_lines(), media_type="application/x-ndjson")
+
+
 @app.get("/orders/user/{user_id}", response_model=List[Order])
-def read_user_orders(
+async def read_user_orders(
     user_id: int, 
     skip: int = 0, 
-    limit: int = 100, 
-    db: Session = Depends(get_db)
+    limit: int = 100
 ):
-    """Get orders for a specific user."""
+    """Get orders for a specific user, streamed as a JSON array."""
+    # The stream outlives the request handler, so it owns its session
+    stream_db = AsyncSessionLocal()
+    orders = iter_user_orders(stream_db, user_id=user_id, skip=skip, limit=limit)
     try:
-        orders = get_user_orders(db, user_id=user_id, skip=skip, limit=limit)
-        return orders
-    except Exception as e:
-        logger.error("Failed to get user orders", error=str(e), user_id=user_id)
+        # Run the query before the response starts, so a failure is still a 500
+        first_order = await anext(orders, None)
+    except Exception:
+        await orders.aclose()
+        await stream_db.close()
+        logger.exception("Failed to get user orders", user_id=user_id)
         raise HTTPException(status_code=500, detail="Internal server error")
+    
+    async def order_array():
+        try:
+            yield b"["
+            if first_order is not None:
+                yield Order.from_db(first_order).model_dump_json()
+                async for db_order in orders:
+                    yield b","
+                    yield Order.from_db(db_order).model_dump_json()
+            yield b"]"
+        except Exception:
+            logger.exception("Failed to get user orders", user_id=user_id)
+            raise
+        finally:
+            await orders.aclose()
+            await stream_db.close()
+    
+    return StreamingResponse(order_array(), media_type="application/json")
 
 
 @app.put("/orders/{order_id}", response_model=Order)
-def update_order_endpoint(
+async def update_order_endpoint(
     order_id: int, 
     order_update: OrderUpdate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update order information."""
     try:
-        db_order = update_order(db=db, order_id=order_id, order_update=order_update)
+        db_order = await update_order(db=db, order_id=order_id, order_update=order_update)
         if db_order is None:
             raise HTTPException(status_code=404, detail="Order not found")
         return db_order
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to update order", error=str(e), order_id=order_id)
+    except Exception:
+        logger.exception("Failed to update order", order_id=order_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Review endpoints
 @app.post("/reviews/", response_model=Review)
-def create_review_endpoint(
+async def create_review_endpoint(
     review: ReviewCreate, 
     user_id: int = 1,  # In production, get from authentication
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new review."""
     try:
-        return create_review(db=db, review=review, user_id=user_id)
-    except Exception as e:
-        logger.error("Failed to create review", error=str(e))
+        return await create_review(db=db, review=review, user_id=user_id)
+    except Exception:
+        logger.exception("Failed to create review")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/reviews/restaurant/{restaurant_id}", response_model=List[Review])
-def read_restaurant_reviews(
+async def read_restaurant_reviews(
     restaurant_id: int, 
     skip: int = 0, 
     limit: int = 100, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get reviews for a specific restaurant."""
     try:
-        reviews = get_restaurant_reviews(db, restaurant_id=restaurant_id, skip=skip, limit=limit)
-        return reviews
-    except Exception as e:
-        logger.error("Failed to get restaurant reviews", error=str(e), restaurant_id=restaurant_id)
+        reviews = await get_restaurant_reviews(db, restaurant_id=restaurant_id, skip=skip, limit=limit)
+        return _json_response(_dump_list(review_list_adapter, Review, reviews))
+    except Exception:
+        logger.exception("Failed to get restaurant reviews", restaurant_id=restaurant_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Delivery driver endpoints
 @app.post("/delivery-drivers/", response_model=DeliveryDriver)
-def create_delivery_driver_endpoint(driver: DeliveryDriverCreate, db: Session = Depends(get_db)):
+async def create_delivery_driver_endpoint(driver: DeliveryDriverCreate, db: AsyncSession = Depends(get_db)):
     """Create a new delivery driver."""
     try:
-        return create_delivery_driver(db=db, driver=driver)
-    except Exception as e:
-        logger.error("Failed to create delivery driver", error=str(e))
+        return await create_delivery_driver(db=db, driver=driver)
+    except Exception:
+        logger.exception("Failed to create delivery driver")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/delivery-drivers/available", response_model=List[DeliveryDriver])
-def read_available_drivers(db: Session = Depends(get_db)):
+async def read_available_drivers(db: AsyncSession = Depends(get_db)):
     """Get all available delivery drivers."""
     try:
-        drivers = get_available_drivers(db)
-        return drivers
-    except Exception as e:
-        logger.error("Failed to get available drivers", error=str(e))
+        drivers = await get_available_drivers(db)
+        return _json_response(_dump_list(delivery_driver_list_adapter, DeliveryDriver, drivers))
+    except Exception:
+        logger.exception("Failed to get available drivers")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -430,8 +634,8 @@ async def system_health():
     try:
         task = monitor_system_health.delay()
         return {"task_id": task.id, "status": "started"}
-    except Exception as e:
-        logger.error("Failed to start system health check", error=str(e))
+    except Exception:
+        logger.exception("Failed to start system health check")
         raise HTTPException(status_code=500, detail="Failed to start system health check")
 
 
@@ -441,18 +645,27 @@ async def startup_event():
     try:
         logger.info("Starting Restaurant Menu System v3.0")
         
-        # Initialize database
-        init_db()
-        logger.info("Database initialized successfully")
+        # Initialize database (skipped per worker when gunicorn already did it)
+        if settings.db_create_tables_on_startup:
+            init_db()
+            engine.dispose()  # The API only uses async_engine after schema creation
+            logger.info("Database initialized successfully")
+        
+        # Compile the hot CRUD statements before the first request
+        try:
+            async with AsyncSessionLocal() as db:
+                await warm_statement_cache(db)
+            logger.info("Statement cache warmed")
+        except Exception:
+            logger.warning("Statement cache warm-up failed", exc_info=True)
         
         # Check Redis connection
-        redis_client = Redis.from_url(get_redis_url())
-        redis_client.ping()
+        await redis_cache.ping()
         logger.info("Redis connection established")
         
         logger.info("Application startup completed")
-    except Exception as e:
-        logger.error("Application startup failed", error=str(e))
+    except Exception:
+        logger.exception("Application startup failed")
         raise
 
 
@@ -461,10 +674,15 @@ async def shutdown_event():
     """Cleanup on application shutdown."""
     try:
         logger.info("Shutting down Restaurant Menu System v3.0")
-        # Add any cleanup logic here
+        shutdown_password_hashing()
+        await async_engine.dispose()
+        await redis_cache.aclose()
+        await redis_pool.disconnect()
         logger.info("Application shutdown completed")
-    except Exception as e:
-        logger.error("Application shutdown failed", error=str(e))
+    except Exception:
+        logger.exception("Application shutdown failed")
+    finally:
+        log_writer.stop()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Index, CheckConstraint
+from sqlalchemy import event
+from sqlalchemy.orm import relationship, with_loader_criteria
 from sqlalchemy.sql import func
-from database import Base
+from database import Base, ApiSession
 import enum
 
 
@@ -21,6 +22,12 @@ class PaymentStatus(str, enum.Enum):
     REFUNDED = "refunded"
 
 
+def _in_values(column: str, enum_cls) -> str:
+    """SQL CHECK expression restricting a string column to an enum's values."""
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return f"{column} IN ({values})"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -33,7 +40,7 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     orders = relationship("Order", back_populates="user")
@@ -55,7 +62,13 @@ class Restaurant(Base):
     delivery_fee = Column(Float, default=0.0)
     minimum_order = Column(Float, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Restaurant listing filtered by cuisine; deleted rows are never listed
+        Index("ix_restaurants_cuisine_active", cuisine_type,
+              postgresql_where=is_active.is_(True)),
+    )
 
     # Relationships
     menu_items = relationship("MenuItem", back_populates="restaurant")
@@ -90,7 +103,13 @@ class MenuItem(Base):
     restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Menu listing: WHERE restaurant_id = ? AND is_available
+        Index("ix_menu_items_restaurant_available", restaurant_id,
+              postgresql_where=is_available.is_(True)),
+    )
 
     # Relationships
     restaurant = relationship("Restaurant", back_populates="menu_items")
@@ -104,15 +123,27 @@ class Order(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
-    status = Column(Enum(OrderStatus), default=OrderStatus.PENDING)
-    payment_status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING)
+    status = Column(String(16), nullable=False, default=OrderStatus.PENDING.value, index=True)
+    payment_status = Column(String(16), nullable=False, default=PaymentStatus.PENDING.value)
     total_amount = Column(Float, nullable=False)
     delivery_address = Column(String, nullable=False)
     delivery_instructions = Column(Text)
     estimated_delivery_time = Column(DateTime(timezone=True))
     actual_delivery_time = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Order history pages: filter by owner, newest first
+        Index("ix_orders_user_created", user_id, created_at.desc()),
+        Index("ix_orders_restaurant_created", restaurant_id, created_at.desc()),
+        # "My active orders": filter by owner and status, newest first
+        Index("ix_orders_user_status_created", user_id, status, created_at.desc()),
+        # Plain strings instead of native Postgres enums; adding a status is
+        # a constraint change rather than an ALTER TYPE
+        CheckConstraint(_in_values("status", OrderStatus), name="ck_orders_status"),
+        CheckConstraint(_in_values("payment_status", PaymentStatus), name="ck_orders_payment_status"),
+    )
 
     # Relationships
     user = relationship("User", back_populates="orders")
@@ -149,6 +180,10 @@ class Review(Base):
     is_verified = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_reviews_restaurant_created", restaurant_id, created_at.desc()),
+    )
+
     # Relationships
     user = relationship("User", back_populates="reviews")
     restaurant = relationship("Restaurant", back_populates="reviews")
@@ -167,7 +202,13 @@ class DeliveryDriver(Base):
     current_location = Column(String)
     rating = Column(Float, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Driver assignment and the available-drivers list only scan free drivers
+        Index("ix_delivery_drivers_available", id,
+              postgresql_where=is_available.is_(True)),
+    )
 
     # Relationships
     deliveries = relationship("Delivery", back_populates="driver")
@@ -183,8 +224,39 @@ class Delivery(Base):
     delivery_time = Column(DateTime(timezone=True))
     status = Column(String, default="assigned")  # assigned, picked_up, delivered
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     order = relationship("Order")
-    driver = relationship("DeliveryDriver", back_populates="deliveries") 
\ No newline at end of file
+    driver = relationship("DeliveryDriver", back_populates="deliveries") 
+
+
+# Soft-deleted rows the API should never return
+_SOFT_DELETE_CRITERIA = {
+    Restaurant: Restaurant.is_active.is_(True),
+    Category: Category.is_active.is_(True),
+    MenuItem: MenuItem.is_available.is_(True),
+}
+
+
+@event.listens_for(ApiSession, "do_orm_execute")
+def _hide_soft_deleted_rows(execute_state):
+    """Filter soft-deleted rows out of API queries unless include_deleted is set.
+
+    Only the statement's primary entity is filtered, so eager-loaded parents of
+    live rows (e.g. an old order's closed restaurant) still load.
+    """
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get("include_deleted", False)
+    ):
+        return
+    
+    mapper = execute_state.bind_mapper
+    criteria = _SOFT_DELETE_CRITERIA.get(mapper.class_) if mapper is not None else None
+    if criteria is not None:
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(mapper.class_, criteria, include_aliases=True)
+        )
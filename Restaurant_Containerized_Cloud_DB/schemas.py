@@ -1,16 +1,75 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, TypeAdapter, field_validator
+from typing import Annotated, Any, Dict, Generic, List, Optional, Tuple, TypeVar, get_args, get_origin
 from datetime import datetime
+from enum import Enum
+from config import settings
 from models import OrderStatus, PaymentStatus
 
 
+# Contact emails on restaurants and drivers only need a shape check; the full
+# email-validator parse (EmailStr) is kept for user accounts. The pattern is
+# compiled once, when the schemas are built.
+ContactEmail = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
+
+
+T = TypeVar("T")
+
+
 # Base schemas
 class BaseSchema(BaseModel):
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # Pydantic v2 already serializes datetimes as ISO 8601
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_db(cls, obj: Any) -> "BaseSchema":
+        """Build a response model from an ORM object or Row.
+
+        Rows were validated on the way in, so with SKIP_OUTPUT_VALIDATION set the
+        field validators are skipped (model_construct); otherwise this is
+        model_validate.
+        """
+        if not settings.skip_output_validation:
+            return cls.model_validate(obj)
+        return _construct(cls, obj)
+
+
+# Per schema: (field name, kind, nested type) where kind says how to convert the
+# attribute when skipping validation. Computed once per class.
+_CONSTRUCT_PLANS: Dict[type, Tuple[Tuple[str, Optional[str], Any], ...]] = {}
+
+
+def _construct_plan(cls: type) -> Tuple[Tuple[str, Optional[str], Any], ...]:
+    plan = _CONSTRUCT_PLANS.get(cls)
+    if plan is None:
+        steps = []
+        for name, field in cls.model_fields.items():
+            annotation = field.annotation
+            if get_origin(annotation) is list and isinstance(get_args(annotation)[0], type) \
+                    and issubclass(get_args(annotation)[0], BaseSchema):
+                steps.append((name, "list", get_args(annotation)[0]))
+            elif isinstance(annotation, type) and issubclass(annotation, BaseSchema):
+                steps.append((name, "model", annotation))
+            elif isinstance(annotation, type) and issubclass(annotation, Enum):
+                steps.append((name, "enum", annotation))
+            else:
+                steps.append((name, None, None))
+        plan = _CONSTRUCT_PLANS[cls] = tuple(steps)
+    return plan
+
+
+def _construct(cls: type, obj: Any) -> BaseSchema:
+    values = {}
+    for name, kind, target in _construct_plan(cls):
+        value = getattr(obj, name, None)
+        if value is not None:
+            if kind == "model":
+                value = _construct(target, value)
+            elif kind == "list":
+                value = [_construct(target, item) for item in value]
+            elif kind == "enum":
+                value = target(value)
+        values[name] = value
+    return cls.model_construct(**values)
 
 
 # User schemas
@@ -46,7 +105,7 @@ class RestaurantBase(BaseSchema):
     description: Optional[str] = None
     address: str = Field(..., min_length=1)
     phone: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[ContactEmail] = None
     cuisine_type: Optional[str] = None
     delivery_fee: float = Field(0.0, ge=0)
     minimum_order: float = Field(0.0, ge=0)
@@ -61,7 +120,7 @@ class RestaurantUpdate(BaseSchema):
     description: Optional[str] = None
     address: Optional[str] = Field(None, min_length=1)
     phone: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[ContactEmail] = None
     cuisine_type: Optional[str] = None
     delivery_fee: Optional[float] = Field(None, ge=0)
     minimum_order: Optional[float] = Field(None, ge=0)
@@ -75,6 +134,15 @@ class Restaurant(RestaurantBase):
     updated_at: Optional[datetime] = None
 
 
+class RestaurantListItem(BaseSchema):
+    """Fields shown in restaurant listings; selected as columns, not ORM rows."""
+    id: int
+    name: str
+    cuisine_type: Optional[str] = None
+    rating: float
+    delivery_fee: float
+
+
 # Category schemas
 class CategoryBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=50)
@@ -131,6 +199,15 @@ class MenuItem(MenuItemBase):
     category: Category
 
 
+class MenuItemSummary(BaseSchema):
+    """Fields shown in a restaurant's menu listing."""
+    id: int
+    name: str
+    price: float
+    preparation_time: int
+    category_id: int
+
+
 # OrderItem schemas
 class OrderItemBase(BaseSchema):
     menu_item_id: int
@@ -160,7 +237,8 @@ class OrderBase(BaseSchema):
 class OrderCreate(OrderBase):
     order_items: List[OrderItemCreate]
 
-    @validator('order_items')
+    @field_validator('order_items')
+    @classmethod
     def validate_order_items(cls, v):
         if not v:
             raise ValueError('Order must contain at least one item')
@@ -219,7 +297,7 @@ class Review(ReviewBase):
 class DeliveryDriverBase(BaseSchema):
     name: str = Field(..., min_length=1, max_length=100)
     phone: str = Field(..., min_length=10)
-    email: Optional[EmailStr] = None
+    email: Optional[ContactEmail] = None
     vehicle_number: Optional[str] = None
 
 
@@ -230,7 +308,7 @@ class DeliveryDriverCreate(DeliveryDriverBase):
 class DeliveryDriverUpdate(BaseSchema):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     phone: Optional[str] = Field(None, min_length=10)
-    email: Optional[EmailStr] = None
+    email: Optional[ContactEmail] = None
     vehicle_number: Optional[str] = None
     current_location: Optional[str] = None
     is_available: Optional[bool] = None
@@ -274,14 +352,15 @@ class Delivery(DeliveryBase):
 # Response schemas
 class HealthCheck(BaseSchema):
     status: str
-    timestamp: datetime
+    timestamp: int  # Milliseconds since the Unix epoch
     database: bool
     redis: bool
     version: str = "3.0.0"
 
 
-class PaginatedResponse(BaseSchema):
-    items: List[dict]
+class PaginatedResponse(BaseSchema, Generic[T]):
+    """A page of items; parametrize with the item schema, e.g. PaginatedResponse[Restaurant]."""
+    items: List[T]
     total: int
     page: int
     size: int
@@ -300,4 +379,16 @@ class TokenData(BaseSchema):
 
 class LoginRequest(BaseSchema):
     username: str
-    password: str 
\ No newline at end of file
+    password: str 
+
+
+# List serializers, built once: validating and dumping a whole page through one
+# TypeAdapter call keeps the per-item work in pydantic-core
+user_list_adapter = TypeAdapter(List[User])
+restaurant_list_adapter = TypeAdapter(List[RestaurantListItem])
+category_list_adapter = TypeAdapter(List[Category])
+menu_item_list_adapter = TypeAdapter(List[MenuItem])
+menu_item_summary_list_adapter = TypeAdapter(List[MenuItemSummary])
+order_list_adapter = TypeAdapter(List[Order])
+review_list_adapter = TypeAdapter(List[Review])
+delivery_driver_list_adapter = TypeAdapter(List[DeliveryDriver])
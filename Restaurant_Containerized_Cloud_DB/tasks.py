@@ -1,77 +1,120 @@
+from celery import chain, group
 from celery_app import celery_app
-from sqlalchemy.orm import Session
-from database import SessionLocal, get_db_stats
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session, load_only, raiseload
+from config import settings, get_redis_url
+from redis import Redis
+from database import get_db_stats, task_session
 from models import Order, OrderItem, Restaurant, User, Review, DeliveryDriver, Delivery
-from schemas import OrderCreate, OrderStatus, PaymentStatus
+from schemas import OrderStatus, PaymentStatus
+from internal_schemas import OrderTaskPayload
 from datetime import datetime, timedelta
 import structlog
-import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 
 logger = structlog.get_logger()
 
+# Task queries load exactly the columns they use; with CELERY_STRICT_LOADING set,
+# any relationship touched without an explicit loader option raises instead of
+# silently emitting another SELECT.
+_STRICT_LOADING = (raiseload("*"),) if settings.celery_strict_loading else ()
+
+# Simulated latency of the payment gateway and notification providers. It is
+# applied as a broker-side countdown, so no worker process sleeps through it.
+PAYMENT_DELAY_SECONDS = 2
+NOTIFICATION_DELAY_SECONDS = 1
+
+_ANALYTICS_REPORT_KEY = "analytics:report"
+_ANALYTICS_REPORT_TTL = 60
+
+# Shared by every task in this worker process; redis-py pools connections itself.
+# Short timeouts so a stuck Redis cannot hold a worker slot.
+redis_client = Redis.from_url(
+    get_redis_url(),
+    socket_connect_timeout=1,
+    socket_timeout=1,
+    health_check_interval=30,
+)
+
+# Broadcast inspector reused by the health monitor
+_inspector = celery_app.control.inspect(timeout=1.0)
+
+
+def _cached_report() -> Optional[Dict[str, Any]]:
+    """Return the last analytics report if it is still fresh, else None."""
+    try:
+        cached = redis_client.get(_ANALYTICS_REPORT_KEY)
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning("Analytics cache read failed", error=str(e))
+        return None
+
+
+def _cache_report(report: Dict[str, Any]):
+    """Keep a generated report around for a minute; failures are only logged."""
+    try:
+        redis_client.set(_ANALYTICS_REPORT_KEY, json.dumps(report), ex=_ANALYTICS_REPORT_TTL)
+    except Exception as e:
+        logger.warning("Analytics cache write failed", error=str(e))
+
+
+def _invalidate_cached(*keys: str):
+    """Drop API response cache entries after a task changes their rows; failures are only logged."""
+    try:
+        redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning("Cache invalidation failed", error=str(e), keys=keys)
+
 
 @celery_app.task(bind=True, max_retries=3)
 def process_order(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
     """Process a new order with comprehensive workflow."""
     try:
-        logger.info("Starting order processing", order_id=order_data.get("id"))
-        
-        # Simulate order processing steps
-        steps = [
-            "validating_order",
-            "checking_inventory",
-            "calculating_total",
-            "processing_payment",
-            "assigning_driver",
-            "sending_notifications"
-        ]
-        
-        for step in steps:
-            logger.info(f"Processing step: {step}")
-            time.sleep(1)  # Simulate processing time
-            
-            # Update order status based on step
-            if step == "validating_order":
-                update_order_status.delay(order_data["id"], OrderStatus.CONFIRMED)
-            elif step == "checking_inventory":
-                update_order_status.delay(order_data["id"], OrderStatus.PREPARING)
-            elif step == "processing_payment":
-                process_payment.delay(order_data["id"])
-            elif step == "assigning_driver":
-                assign_delivery_driver.delay(order_data["id"])
-            elif step == "sending_notifications":
-                send_order_notifications.delay(order_data["id"])
-        
-        logger.info("Order processing completed", order_id=order_data.get("id"))
-        return {"status": "success", "order_id": order_data.get("id")}
+        order_id = OrderTaskPayload.from_message(order_data).id
+        logger.info("Starting order processing", order_id=order_id)
+        
+        # Each step runs as its own task once the previous one succeeds, so this
+        # orchestrator returns immediately instead of holding a worker slot. The
+        # steps raise (after their retries) on failure, which stops the chain.
+        workflow = chain(
+            update_order_status.si(order_id, OrderStatus.CONFIRMED),
+            update_order_status.si(order_id, OrderStatus.PREPARING),
+            process_payment.si(order_id).set(countdown=PAYMENT_DELAY_SECONDS),
+            assign_delivery_driver.si(order_id),
+            send_order_notifications.si(order_id),
+        )
+        result = workflow.apply_async()
+        
+        logger.info("Order workflow dispatched", order_id=order_id, workflow_id=result.id)
+        return {"status": "success", "order_id": order_id, "workflow_id": result.id}
         
     except Exception as e:
         logger.error("Order processing failed", error=str(e), order_id=order_data.get("id"))
         raise self.retry(countdown=60, max_retries=3)
 
 
-@celery_app.task
-def update_order_status(order_id: int, status: OrderStatus) -> Dict[str, Any]:
+@celery_app.task(bind=True, max_retries=3)
+def update_order_status(self, order_id: int, status: OrderStatus) -> Dict[str, Any]:
     """Update order status in database."""
     try:
-        db = SessionLocal()
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.status = status
-            order.updated_at = datetime.utcnow()
-            db.commit()
-            logger.info("Order status updated", order_id=order_id, status=status)
-            return {"status": "success", "order_id": order_id, "new_status": status}
-        else:
-            logger.error("Order not found", order_id=order_id)
-            return {"status": "error", "message": "Order not found"}
+        with task_session() as db:
+            order = db.query(Order).options(
+                load_only(Order.id, Order.status), *_STRICT_LOADING
+            ).filter(Order.id == order_id).first()
+            if order:
+                order.status = status
+                logger.info("Order status updated", order_id=order_id, status=status)
+                return {"status": "success", "order_id": order_id, "new_status": status}
+            else:
+                logger.error("Order not found", order_id=order_id)
+                raise LookupError(f"Order {order_id} not found")
+        
+    except LookupError:
+        raise
     except Exception as e:
         logger.error("Failed to update order status", error=str(e), order_id=order_id)
-        return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
+        raise self.retry(exc=e, countdown=30)
 
 
 @celery_app.task(bind=True, max_retries=3)
@@ -80,69 +123,69 @@ def process_payment(self, order_id: int) -> Dict[str, Any]:
     try:
         logger.info("Processing payment", order_id=order_id)
         
-        # Simulate payment processing
-        time.sleep(2)
-        
         # Update payment status
-        db = SessionLocal()
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if order:
-            order.payment_status = PaymentStatus.PAID
-            order.updated_at = datetime.utcnow()
-            db.commit()
-            
-            logger.info("Payment processed successfully", order_id=order_id)
-            return {"status": "success", "order_id": order_id, "payment_status": "paid"}
-        else:
-            logger.error("Order not found for payment", order_id=order_id)
-            return {"status": "error", "message": "Order not found"}
+        with task_session() as db:
+            order = db.query(Order).options(
+                load_only(Order.id, Order.payment_status), *_STRICT_LOADING
+            ).filter(Order.id == order_id).first()
+            if order:
+                order.payment_status = PaymentStatus.PAID
             
+                logger.info("Payment processed successfully", order_id=order_id)
+                return {"status": "success", "order_id": order_id, "payment_status": "paid"}
+            else:
+                logger.error("Order not found for payment", order_id=order_id)
+                raise LookupError(f"Order {order_id} not found")
+        
+    except LookupError:
+        raise
     except Exception as e:
         logger.error("Payment processing failed", error=str(e), order_id=order_id)
-        raise self.retry(countdown=30, max_retries=3)
-    finally:
-        db.close()
+        raise self.retry(exc=e, countdown=30, max_retries=3)
 
 
-@celery_app.task
-def assign_delivery_driver(order_id: int) -> Dict[str, Any]:
+@celery_app.task(bind=True, max_retries=3)
+def assign_delivery_driver(self, order_id: int) -> Dict[str, Any]:
     """Assign a delivery driver to an order."""
     try:
         logger.info("Assigning delivery driver", order_id=order_id)
         
-        db = SessionLocal()
-        
-        # Find available driver
-        driver = db.query(DeliveryDriver).filter(
-            DeliveryDriver.is_available == True
-        ).first()
-        
-        if driver:
-            # Create delivery record
-            delivery = Delivery(
-                order_id=order_id,
-                driver_id=driver.id,
-                status="assigned"
-            )
-            db.add(delivery)
-            db.commit()
-            
-            logger.info("Driver assigned", order_id=order_id, driver_id=driver.id)
-            return {
-                "status": "success",
-                "order_id": order_id,
-                "driver_id": driver.id,
-                "driver_name": driver.name
-            }
-        else:
-            logger.warning("No available drivers", order_id=order_id)
-            return {"status": "error", "message": "No available drivers"}
+        with task_session() as db:
+            # Claim an available driver; rows locked by a concurrent assignment
+            # are skipped, so two workers never get the same driver
+            driver = db.query(DeliveryDriver).options(
+                load_only(DeliveryDriver.id, DeliveryDriver.name, DeliveryDriver.is_available),
+                *_STRICT_LOADING
+            ).filter(
+                DeliveryDriver.is_available == True
+            ).with_for_update(skip_locked=True).first()
+        
+            if driver:
+                driver.is_available = False
+                
+                # Create delivery record
+                delivery = Delivery(
+                    order_id=order_id,
+                    driver_id=driver.id,
+                    status="assigned"
+                )
+                db.add(delivery)
             
+                logger.info("Driver assigned", order_id=order_id, driver_id=driver.id)
+                return {
+                    "status": "success",
+                    "order_id": order_id,
+                    "driver_id": driver.id,
+                    "driver_name": driver.name
+                }
+            else:
+                logger.warning("No available drivers", order_id=order_id)
+                raise RuntimeError("No available drivers")
+        
     except Exception as e:
+        # Also covers no free driver: one may be released before the next attempt
         logger.error("Driver assignment failed", error=str(e), order_id=order_id)
-        return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
+        raise self.retry(exc=e, countdown=60)
 
 
 @celery_app.task
@@ -151,33 +194,39 @@ def send_order_notifications(order_id: int) -> Dict[str, Any]:
     try:
         logger.info("Sending order notifications", order_id=order_id)
         
-        db = SessionLocal()
-        order = db.query(Order).filter(Order.id == order_id).first()
-        
-        if order:
-            # Send notification to customer
-            send_customer_notification.delay(
-                user_id=order.user_id,
-                message=f"Your order #{order_id} has been confirmed and is being prepared."
-            )
-            
-            # Send notification to restaurant
-            send_restaurant_notification.delay(
-                restaurant_id=order.restaurant_id,
-                message=f"New order #{order_id} received."
-            )
+        with task_session() as db:
+            order = db.query(Order).with_entities(
+                Order.user_id, Order.restaurant_id
+            ).filter(Order.id == order_id).first()
+        
+            if order:
+                # Send notification to customer
+                send_customer_notification.apply_async(
+                    kwargs={
+                        "user_id": order.user_id,
+                        "message": f"Your order #{order_id} has been confirmed and is being prepared.",
+                    },
+                    countdown=NOTIFICATION_DELAY_SECONDS,
+                )
             
-            logger.info("Notifications sent", order_id=order_id)
-            return {"status": "success", "order_id": order_id}
-        else:
-            logger.error("Order not found for notifications", order_id=order_id)
-            return {"status": "error", "message": "Order not found"}
+                # Send notification to restaurant
+                send_restaurant_notification.apply_async(
+                    kwargs={
+                        "restaurant_id": order.restaurant_id,
+                        "message": f"New order #{order_id} received.",
+                    },
+                    countdown=NOTIFICATION_DELAY_SECONDS,
+                )
             
+                logger.info("Notifications sent", order_id=order_id)
+                return {"status": "success", "order_id": order_id}
+            else:
+                logger.error("Order not found for notifications", order_id=order_id)
+                return {"status": "error", "message": "Order not found"}
+        
     except Exception as e:
         logger.error("Notification sending failed", error=str(e), order_id=order_id)
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
 
 
 @celery_app.task
@@ -186,9 +235,7 @@ def send_customer_notification(user_id: int, message: str) -> Dict[str, Any]:
     try:
         logger.info("Sending customer notification", user_id=user_id, message=message)
         
-        # Simulate sending notification (email, SMS, push notification)
-        time.sleep(1)
-        
+        # Sending (email, SMS, push notification) is simulated
         logger.info("Customer notification sent", user_id=user_id)
         return {"status": "success", "user_id": user_id, "message": message}
         
@@ -203,9 +250,7 @@ def send_restaurant_notification(restaurant_id: int, message: str) -> Dict[str,
     try:
         logger.info("Sending restaurant notification", restaurant_id=restaurant_id, message=message)
         
-        # Simulate sending notification
-        time.sleep(1)
-        
+        # Sending is simulated
         logger.info("Restaurant notification sent", restaurant_id=restaurant_id)
         return {"status": "success", "restaurant_id": restaurant_id, "message": message}
         
@@ -220,25 +265,26 @@ def update_restaurant_rating(restaurant_id: int) -> Dict[str, Any]:
     try:
         logger.info("Updating restaurant rating", restaurant_id=restaurant_id)
         
-        db = SessionLocal()
-        
-        # Calculate average rating from recent reviews
-        recent_reviews = db.query(Review).filter(
-            Review.restaurant_id == restaurant_id,
-            Review.created_at >= datetime.utcnow() - timedelta(days=30)
-        ).all()
-        
-        if recent_reviews:
-            avg_rating = sum(review.rating for review in recent_reviews) / len(recent_reviews)
-            
-            # Update restaurant rating
-            restaurant = db.query(Restaurant).filter(Restaurant.id == restaurant_id).first()
-            if restaurant:
-                restaurant.rating = round(avg_rating, 2)
-                db.commit()
-                
-                logger.info("Restaurant rating updated", restaurant_id=restaurant_id, new_rating=avg_rating)
-                return {"status": "success", "restaurant_id": restaurant_id, "new_rating": avg_rating}
+        with task_session() as db:
+            # Average recent reviews and store the result in a single UPDATE; rows
+            # without recent reviews are left alone (AVG of no rows is NULL)
+            avg_rating = select(func.avg(Review.rating)).where(
+                Review.restaurant_id == restaurant_id,
+                Review.created_at >= datetime.utcnow() - timedelta(days=30)
+            ).scalar_subquery()
+            new_rating = db.execute(
+                update(Restaurant)
+                .where(Restaurant.id == restaurant_id, avg_rating.isnot(None))
+                .values(rating=func.round(avg_rating, 2))
+                .returning(Restaurant.rating)
+                .execution_options(synchronize_session=False)
+            ).scalar_one_or_none()
+        
+        if new_rating is not None:
+            # Committed once the session block exits; the API's cached copy is stale now
+            _invalidate_cached(f"restaurant:{restaurant_id}")
+            logger.info("Restaurant rating updated", restaurant_id=restaurant_id, new_rating=new_rating)
+            return {"status": "success", "restaurant_id": restaurant_id, "new_rating": new_rating}
         
         logger.info("No recent reviews to update rating", restaurant_id=restaurant_id)
         return {"status": "success", "message": "No recent reviews"}
@@ -246,8 +292,6 @@ def update_restaurant_rating(restaurant_id: int) -> Dict[str, Any]:
     except Exception as e:
         logger.error("Rating update failed", error=str(e), restaurant_id=restaurant_id)
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
 
 
 @celery_app.task
@@ -256,31 +300,24 @@ def cleanup_expired_orders() -> Dict[str, Any]:
     try:
         logger.info("Starting cleanup of expired orders")
         
-        db = SessionLocal()
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
+        with task_session() as db:
+            cutoff_time = datetime.utcnow() - timedelta(hours=24)
         
-        # Find expired pending orders
-        expired_orders = db.query(Order).filter(
-            Order.status == OrderStatus.PENDING,
-            Order.created_at < cutoff_time
-        ).all()
-        
-        cleaned_count = 0
-        for order in expired_orders:
-            order.status = OrderStatus.CANCELLED
-            order.payment_status = PaymentStatus.FAILED
-            cleaned_count += 1
-        
-        db.commit()
+            # Cancel expired pending orders in one statement
+            result = db.execute(
+                update(Order)
+                .where(Order.status == OrderStatus.PENDING, Order.created_at < cutoff_time)
+                .values(status=OrderStatus.CANCELLED, payment_status=PaymentStatus.FAILED)
+                .execution_options(synchronize_session=False)
+            )
+            cleaned_count = result.rowcount
         
-        logger.info("Cleanup completed", cleaned_count=cleaned_count)
-        return {"status": "success", "cleaned_count": cleaned_count}
+            logger.info("Cleanup completed", cleaned_count=cleaned_count)
+            return {"status": "success", "cleaned_count": cleaned_count}
         
     except Exception as e:
         logger.error("Cleanup failed", error=str(e))
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
 
 
 @celery_app.task
@@ -289,29 +326,35 @@ def send_delivery_reminders() -> Dict[str, Any]:
     try:
         logger.info("Sending delivery reminders")
         
-        db = SessionLocal()
-        
-        # Find orders that are ready for delivery
-        ready_orders = db.query(Order).filter(
-            Order.status == OrderStatus.READY
-        ).all()
-        
-        reminder_count = 0
-        for order in ready_orders:
-            # Send reminder to assigned driver
-            delivery = db.query(Delivery).filter(Delivery.order_id == order.id).first()
-            if delivery:
-                send_driver_reminder.delay(delivery.driver_id, order.id)
-                reminder_count += 1
-        
-        logger.info("Delivery reminders sent", reminder_count=reminder_count)
-        return {"status": "success", "reminder_count": reminder_count}
+        with task_session() as db:
+            # Ready orders paired with their assigned driver, in one query,
+            # streamed from a server-side cursor 1000 rows at a time
+            assignments = db.query(Order.id, Delivery.driver_id).join(
+                Delivery, Delivery.order_id == Order.id
+            ).filter(
+                Order.status == OrderStatus.READY
+            ).yield_per(1000)
+        
+            # Publish each streamed batch as one group over a single producer
+            # connection instead of one broker round trip per reminder
+            reminder_count = 0
+            batch = []
+            for order_id, driver_id in assignments:
+                batch.append(send_driver_reminder.si(driver_id, order_id))
+                if len(batch) == 1000:
+                    group(batch).apply_async(countdown=NOTIFICATION_DELAY_SECONDS)
+                    reminder_count += len(batch)
+                    batch = []
+            if batch:
+                group(batch).apply_async(countdown=NOTIFICATION_DELAY_SECONDS)
+                reminder_count += len(batch)
+        
+            logger.info("Delivery reminders sent", reminder_count=reminder_count)
+            return {"status": "success", "reminder_count": reminder_count}
         
     except Exception as e:
         logger.error("Delivery reminders failed", error=str(e))
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
 
 
 @celery_app.task
@@ -320,9 +363,7 @@ def send_driver_reminder(driver_id: int, order_id: int) -> Dict[str, Any]:
     try:
         logger.info("Sending driver reminder", driver_id=driver_id, order_id=order_id)
         
-        # Simulate sending reminder
-        time.sleep(1)
-        
+        # Sending is simulated
         logger.info("Driver reminder sent", driver_id=driver_id, order_id=order_id)
         return {"status": "success", "driver_id": driver_id, "order_id": order_id}
         
@@ -337,76 +378,77 @@ def process_pending_payments() -> Dict[str, Any]:
     try:
         logger.info("Processing pending payments")
         
-        db = SessionLocal()
-        
-        # Find orders with pending payments
-        pending_orders = db.query(Order).filter(
-            Order.payment_status == PaymentStatus.PENDING,
-            Order.created_at >= datetime.utcnow() - timedelta(hours=1)
-        ).all()
-        
-        processed_count = 0
-        for order in pending_orders:
-            # Simulate payment processing
-            time.sleep(0.5)
-            
-            # Update payment status (simulate successful payment)
-            order.payment_status = PaymentStatus.PAID
-            processed_count += 1
-        
-        db.commit()
+        with task_session() as db:
+            # Mark recent pending payments as paid (simulated) in one statement
+            result = db.execute(
+                update(Order)
+                .where(
+                    Order.payment_status == PaymentStatus.PENDING,
+                    Order.created_at >= datetime.utcnow() - timedelta(hours=1)
+                )
+                .values(payment_status=PaymentStatus.PAID)
+                .execution_options(synchronize_session=False)
+            )
+            processed_count = result.rowcount
         
-        logger.info("Pending payments processed", processed_count=processed_count)
-        return {"status": "success", "processed_count": processed_count}
+            logger.info("Pending payments processed", processed_count=processed_count)
+            return {"status": "success", "processed_count": processed_count}
         
     except Exception as e:
         logger.error("Payment processing failed", error=str(e))
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
 
 
-@celery_app.task
+@celery_app.task(ignore_result=False)
 def generate_analytics_report() -> Dict[str, Any]:
     """Generate analytics report for the system."""
     try:
         logger.info("Generating analytics report")
         
-        db = SessionLocal()
-        
-        # Calculate various metrics
-        total_orders = db.query(Order).count()
-        total_revenue = db.query(Order).filter(Order.payment_status == PaymentStatus.PAID).with_entities(
-            db.func.sum(Order.total_amount)
-        ).scalar() or 0
-        
-        avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
-        
-        # Get top restaurants
-        top_restaurants = db.query(Restaurant).order_by(Restaurant.rating.desc()).limit(5).all()
-        
-        report = {
-            "total_orders": total_orders,
-            "total_revenue": float(total_revenue),
-            "avg_order_value": float(avg_order_value),
-            "top_restaurants": [
-                {"id": r.id, "name": r.name, "rating": r.rating}
-                for r in top_restaurants
-            ],
-            "generated_at": datetime.utcnow().isoformat()
-        }
+        # Analytics tolerates a minute of staleness; reuse a recent report
+        cached = _cached_report()
+        if cached is not None:
+            logger.info("Analytics report served from cache")
+            return {"status": "success", "report": cached}
+        
+        with task_session() as db:
+            # Order count and paid revenue in one pass over orders
+            total_orders, total_revenue = db.query(
+                func.count(Order.id),
+                func.coalesce(func.sum(case(
+                    (Order.payment_status == PaymentStatus.PAID, Order.total_amount),
+                    else_=0
+                )), 0)
+            ).one()
+        
+            avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
+        
+            # Get top restaurants
+            top_restaurants = db.query(Restaurant).options(
+                load_only(Restaurant.id, Restaurant.name, Restaurant.rating), *_STRICT_LOADING
+            ).order_by(Restaurant.rating.desc()).limit(5).all()
+        
+            report = {
+                "total_orders": total_orders,
+                "total_revenue": float(total_revenue),
+                "avg_order_value": float(avg_order_value),
+                "top_restaurants": [
+                    {"id": r.id, "name": r.name, "rating": r.rating}
+                    for r in top_restaurants
+                ],
+                "generated_at": datetime.utcnow().isoformat()
+            }
+            _cache_report(report)
         
-        logger.info("Analytics report generated", report=report)
-        return {"status": "success", "report": report}
+            logger.info("Analytics report generated", report=report)
+            return {"status": "success", "report": report}
         
     except Exception as e:
         logger.error("Analytics report generation failed", error=str(e))
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
 
 
-@celery_app.task
+@celery_app.task(ignore_result=False)
 def monitor_system_health() -> Dict[str, Any]:
     """Monitor overall system health."""
     try:
@@ -416,13 +458,14 @@ def monitor_system_health() -> Dict[str, Any]:
         db_stats = get_db_stats()
         
         # Check Redis connection
-        from redis import Redis
-        from config import get_redis_url
-        redis_client = Redis.from_url(get_redis_url())
-        redis_healthy = redis_client.ping()
+        try:
+            redis_healthy = redis_client.ping()
+        except Exception as e:
+            logger.warning("Redis ping failed", error=str(e))
+            redis_healthy = False
         
         # Get Celery stats
-        celery_stats = celery_app.control.inspect().stats()
+        celery_stats = _inspector.stats()
         
         health_report = {
             "database": {
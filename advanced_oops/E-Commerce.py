@@ -1,7 +1,16 @@
 # E-Commerce Product Management System with @property
+import re
+
+# Compiled once instead of on every name assignment
+_NAME_RE = re.compile(r'[A-Za-z0-9\- ]+')
+
 
 class Product:
-    _allowed_categories = ['Electronics', 'Clothing', 'Books', 'Home', 'Sports']
+    # Fixed attribute layout: no per-instance __dict__ for catalogs of many products
+    __slots__ = ('_name', '_base_price', '_discount_percent', '_stock_quantity', '_category',
+                 '_final_price', '_savings_amount')
+
+    _allowed_categories = frozenset({'Electronics', 'Clothing', 'Books', 'Home', 'Sports'})
 
     def __init__(self, name, base_price, discount_percent, stock_quantity, category):
         self.name = name
@@ -17,10 +26,9 @@ class Product:
 
     @name.setter
     def name(self, value):
-        import re
         if not (3 <= len(value) <= 50):
             raise ValueError("Name must be between 3 and 50 characters.")
-        if not re.match(r'^[A-Za-z0-9\- ]+$', value):
+        if not _NAME_RE.fullmatch(value):
             raise ValueError("Name can only contain letters, numbers, hyphens, and spaces.")
         self._name = value
 
@@ -31,11 +39,19 @@ class Product:
 
     @base_price.setter
     def base_price(self, value):
-        if not (isinstance(value, (int, float)) and value > 0):
+        # float() would quietly accept True/False as 1.0/0.0
+        if isinstance(value, bool):
+            raise ValueError("Base price must be a positive number.")
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError("Base price must be a positive number.") from None
+        if not value > 0:
             raise ValueError("Base price must be a positive number.")
         if value > 50000:
             raise ValueError("Base price cannot exceed $50,000.")
-        self._base_price = float(value)
+        self._base_price = value
+        self._invalidate_prices()
 
     # discount_percent property
     @property
@@ -44,9 +60,17 @@ class Product:
 
     @discount_percent.setter
     def discount_percent(self, value):
-        if not (isinstance(value, (int, float)) and 0 <= value <= 75):
+        # float() would quietly accept True/False as 1.0/0.0
+        if isinstance(value, bool):
+            raise ValueError("Discount percent must be between 0 and 75.")
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError("Discount percent must be between 0 and 75.") from None
+        if not 0 <= value <= 75:
             raise ValueError("Discount percent must be between 0 and 75.")
-        self._discount_percent = round(float(value), 2)
+        self._discount_percent = round(value, 2)
+        self._invalidate_prices()
 
     # stock_quantity property
     @property
@@ -55,7 +79,7 @@ class Product:
 
     @stock_quantity.setter
     def stock_quantity(self, value):
-        if not (isinstance(value, int) and value >= 0):
+        if type(value) is not int or value < 0:
             raise ValueError("Stock quantity must be a non-negative integer.")
         if value > 10000:
             raise ValueError("Stock quantity cannot exceed 10,000 units.")
@@ -69,17 +93,27 @@ class Product:
     @category.setter
     def category(self, value):
         if value not in self._allowed_categories:
-            raise ValueError(f"Category must be one of {self._allowed_categories}.")
+            raise ValueError(f"Category must be one of {sorted(self._allowed_categories)}.")
         self._category = value
 
     # Calculated properties
+    # final_price and savings_amount are computed on first read and reused until
+    # base_price or discount_percent changes
+    def _invalidate_prices(self):
+        self._final_price = None
+        self._savings_amount = None
+
     @property
     def final_price(self):
-        return round(self.base_price * (1 - self.discount_percent / 100), 2)
+        if self._final_price is None:
+            self._final_price = round(self.base_price * (1 - self.discount_percent / 100), 2)
+        return self._final_price
 
     @property
     def savings_amount(self):
-        return round(self.base_price - self.final_price, 2)
+        if self._savings_amount is None:
+            self._savings_amount = round(self.base_price - self.final_price, 2)
+        return self._savings_amount
 
     @property
     def availability_status(self):
@@ -1,16 +1,29 @@
 # Employee Management System with Class Variables and Methods
 
+import csv
 import re
 from datetime import datetime
 
+# Compiled once; validate_email runs for every hire
+_EMAIL_RE = re.compile(r'[\w.\-]+@[\w.\-]+\.\w+')
+
+# Parsed hire dates by string; batch hires share the same few dates
+_HIRE_DATE_CACHE = {}
+
 class Employee:
+    # Fixed attribute layout: no per-instance __dict__ when hiring in bulk
+    __slots__ = ('employee_id', 'name', 'department', 'base_salary', 'country',
+                 'email', 'hire_date', 'performance_ratings', '_rating_sum')
+
     # Class variables
     company_name = "Multinational Corp"
     total_employees = 0
-    departments = {}  # e.g., {"HR": 2, "Engineering": 5}
     tax_rates = {"USA": 0.2, "India": 0.1, "UK": 0.25}
     next_employee_id = 1
-    approved_departments = ["HR", "Engineering", "Sales", "Marketing", "Finance", "Support"]
+    _id_prefix = None
+    # Headcount per department, with every approved department present from the start
+    departments = dict.fromkeys(["HR", "Engineering", "Sales", "Marketing", "Finance", "Support"], 0)
+    approved_departments = frozenset(departments)  # O(1) membership checks
 
     def __init__(self, name, department, base_salary, country, email, hire_date=None):
         if not Employee.is_valid_department(department):
@@ -26,17 +39,17 @@ class Employee:
         self.email = email
         self.hire_date = hire_date if hire_date else datetime.now().strftime("%Y-%m-%d")
         self.performance_ratings = []
+        self._rating_sum = 0  # Running total so the average is O(1)
 
         # Update class variables
         Employee.total_employees += 1
-        Employee.departments[department] = Employee.departments.get(department, 0) + 1
+        Employee.departments[department] += 1
 
     # ---------- Static Methods ----------
     @staticmethod
     def validate_email(email):
         # Simple regex for email validation and domain check
-        pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.fullmatch(email) is not None
 
     @staticmethod
     def calculate_tax(salary, country):
@@ -49,8 +62,10 @@ class Employee:
 
     @staticmethod
     def generate_employee_id():
-        year = datetime.now().year
-        eid = f"EMP-{year}-{str(Employee.next_employee_id).zfill(4)}"
+        # The "EMP-<year>-" prefix is built once per process instead of per hire
+        if Employee._id_prefix is None:
+            Employee._id_prefix = f"EMP-{datetime.now().year}-"
+        eid = "%s%04d" % (Employee._id_prefix, Employee.next_employee_id)
         Employee.next_employee_id += 1
         return eid
 
@@ -58,7 +73,10 @@ class Employee:
     @classmethod
     def from_csv_data(cls, csv_line):
         # Format: "name,dept,salary,country,email"
-        parts = [x.strip() for x in csv_line.split(",")]
+        return cls._from_csv_fields([x.strip() for x in csv_line.split(",")])
+
+    @classmethod
+    def _from_csv_fields(cls, parts):
         if len(parts) != 5:
             raise ValueError("CSV line must have 5 fields")
         name, dept, salary, country, email = parts
@@ -66,10 +84,7 @@ class Employee:
 
     @classmethod
     def get_department_stats(cls):
-        stats = {}
-        for dept in cls.approved_departments:
-            stats[dept] = cls.departments.get(dept, 0)
-        return stats
+        return cls.departments.copy()
 
     @classmethod
     def set_tax_rate(cls, country, rate):
@@ -78,10 +93,11 @@ class Employee:
     @classmethod
     def hire_bulk_employees(cls, employee_list):
         # employee_list: list of csv lines
+        # csv.reader splits every line in C; fields are stripped as before
         new_employees = []
-        for line in employee_list:
+        for line, row in zip(employee_list, csv.reader(employee_list, skipinitialspace=True)):
             try:
-                emp = cls.from_csv_data(line)
+                emp = cls._from_csv_fields([field.strip() for field in row])
                 new_employees.append(emp)
             except Exception as e:
                 print(f"Error hiring employee from line '{line}': {e}")
@@ -92,18 +108,22 @@ class Employee:
         if not (1 <= rating <= 5):
             raise ValueError("Rating must be between 1 and 5")
         self.performance_ratings.append(rating)
+        self._rating_sum += rating
 
     def get_average_performance(self):
         if not self.performance_ratings:
             return 0
-        return sum(self.performance_ratings) / len(self.performance_ratings)
+        return self._rating_sum / len(self.performance_ratings)
 
     def calculate_net_salary(self):
         tax = Employee.calculate_tax(self.base_salary, self.country)
         return self.base_salary - tax
 
     def get_years_of_service(self):
-        hire = datetime.strptime(self.hire_date, "%Y-%m-%d")
+        # hire_date is always ISO "YYYY-MM-DD"; fromisoformat parses it in C
+        hire = _HIRE_DATE_CACHE.get(self.hire_date)
+        if hire is None:
+            hire = _HIRE_DATE_CACHE[self.hire_date] = datetime.fromisoformat(self.hire_date)
         now = datetime.now()
         years = (now - hire).days / 365.25
         return years
@@ -25,8 +25,9 @@ class TradingAccount:
 class RiskManagement:
     def assess_risk(self, symbol, amount):
         # Dummy risk logic: don't allow trades > 50% of balance
-        if hasattr(self, 'balance'):
-            if amount > self.balance * 0.5:
+        balance = getattr(self, 'balance', None)  # one lookup instead of hasattr + read
+        if balance is not None:
+            if amount > balance * 0.5:
                 print(f"[RiskManagement] Trade for {symbol} is too risky!")
                 return False
             print(f"[RiskManagement] Trade for {symbol} is within risk limits.")
@@ -21,8 +21,23 @@ class BrowserHistory:
             next_page = self.forward_stack.pop()
             self.history.append(next_page)
 
+    # Iterating or sizing the history needs no copy
+    def __iter__(self):
+        return iter(self.history)
+
+    def __len__(self):
+        return len(self.history)
+
+    # Immutable snapshots for callers that need a copy
+    def snapshot_history(self):
+        return tuple(self.history)
+
+    def snapshot_forward_stack(self):
+        return tuple(self.forward_stack)
+
     def get_history(self):
         return list(self.history)
 
     def get_forward_stack(self):
         return list(self.forward_stack)
+
@@ -28,7 +28,8 @@ print(catalog)
 print()
 
 # 4. Find Low Stock Products (quantity < 10)
+# Scans the parallel lists directly rather than the catalog's nested dicts
 print("Low Stock Products (quantity < 10):")
-for product, info in catalog.items():
-    if info["quantity"] < 10:
+for product, quantity in zip(products, quantities):
+    if quantity < 10:
         print(product)
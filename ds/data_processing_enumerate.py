@@ -23,6 +23,6 @@ for i, score in enumerate(scores):
 print()
 
 # 4. Map Positions to Student Names
-position_to_name = {i: name for i, name in enumerate(students)}
+position_to_name = dict(enumerate(students))
 print("Dictionary mapping positions to student names:")
 print(position_to_name)
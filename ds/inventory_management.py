@@ -16,9 +16,7 @@ inventory["bananas"]["price"] = 6
 inventory["apples"]["quantity"] -= 25
 
 # 5. Calculate total inventory value
-total_value = 0
-for product in inventory.values():
-    total_value += product["price"] * product["quantity"]
+total_value = sum(product["price"] * product["quantity"] for product in inventory.values())
 print("Total Inventory Value:", total_value)
 
 # 6. Find low stock products
@@ -1,4 +1,6 @@
 # sales_data_analysis.py
+from itertools import chain
+from operator import itemgetter
 
 sales_data = [
     [("Jan", 1000), ("Feb", 1200), ("Mar", 1100)],
@@ -8,31 +10,20 @@ sales_data = [
 
 # 1. Total sales per quarter
 print("Total sales per quarter:")
-quarter_number = 1
-for quarter in sales_data:
-    total = 0
-    for month, sales in quarter:
-        total += sales
+for quarter_number, quarter in enumerate(sales_data, start=1):
+    total = sum(sales for _, sales in quarter)
     print("Quarter", quarter_number, ":", total)
-    quarter_number += 1
 
 print()
 
-# 2. Find the month with highest sales (using single-line if-else)
-highest_sales = 0
-highest_month = ""
-for quarter in sales_data:
-    for month, sales in quarter:
-        highest_month, highest_sales = (month, sales) if sales > highest_sales else (highest_month, highest_sales)
+# 2. Find the month with highest sales (max() compares in C)
+highest_month, highest_sales = max(chain.from_iterable(sales_data), key=itemgetter(1))
 print("Month with highest sales:", highest_month, "(", highest_sales, ")")
 
 print()
 
 # 3. Create a flat list of monthly sales
-flat_list = []
-for quarter in sales_data:
-    for month, sales in quarter:
-        flat_list.append((month, sales))
+flat_list = list(chain.from_iterable(sales_data))
 print("Flat list of monthly sales:")
 print(flat_list)
 
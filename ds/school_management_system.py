@@ -1,4 +1,6 @@
 # school_management_system.py
+from itertools import chain
+from operator import itemgetter
 
 school = {
     "ClassA": {
@@ -36,19 +38,17 @@ print()
 # 2. Calculate Class Average Grades
 print("Class Average Grades:")
 for class_name, class_info in school.items():
-    grades = list(class_info["students"].values())
-    avg_grade = sum(grades) / len(grades)
+    grades = class_info["students"]
+    avg_grade = sum(grades.values()) / len(grades)
     print(f"{class_name}: {avg_grade:.2f}")
 print()
 
 # 3. Find Top Student Across All Classes
-top_student = None
-top_grade = -1
-for class_info in school.values():
-    for student_name, grade in class_info["students"].items():
-        if grade > top_grade:
-            top_grade = grade
-            top_student = student_name
+# max() keeps the first student on ties, like a strict ">" scan
+top_student, top_grade = max(
+    chain.from_iterable(class_info["students"].items() for class_info in school.values()),
+    key=itemgetter(1),
+)
 
 print(f"Top Student Across All Classes: {top_student} with grade {top_grade}")
 print()
@@ -1,6 +1,7 @@
 # social_media_analytics.py
 
 from collections import Counter, defaultdict
+from itertools import chain
 
 # Example data
 users = [
@@ -19,20 +20,22 @@ posts = [
 ]
 
 # 1. Most Popular Tags
-all_tags = []
-for post in posts:
-    all_tags.extend(post["tags"])
-tag_counter = Counter(all_tags)
+tag_counter = Counter(chain.from_iterable(post["tags"] for post in posts))
 most_common_tags = tag_counter.most_common()
 print("Most Popular Tags:")
 for tag, count in most_common_tags:
     print(f"{tag}: {count}")
 print()
 
+# Index users and posts by user id once instead of scanning the lists per lookup
+users_by_id = {user["id"]: user for user in users}
+
 # 2. User Engagement Analysis (total likes per user)
 user_likes = defaultdict(int)
+posts_by_user = defaultdict(list)
 for post in posts:
     user_likes[post["user_id"]] += post["likes"]
+    posts_by_user[post["user_id"]].append(post)
 print("Total Likes Per User:")
 for user in users:
     print(f"{user['name']}: {user_likes[user['id']]}")
@@ -42,15 +45,15 @@ print()
 sorted_posts = sorted(posts, key=lambda x: x["likes"], reverse=True)
 print("Top Posts by Likes:")
 for post in sorted_posts:
-    user_name = next(user["name"] for user in users if user["id"] == post["user_id"])
+    user_name = users_by_id[post["user_id"]]["name"]
     print(f"Post ID {post['id']} by {user_name}: {post['likes']} likes")
 print()
 
 # 4. User Activity Summary
 user_summary = {}
 for user in users:
-    user_posts = [post for post in posts if post["user_id"] == user["id"]]
-    total_likes = sum(post["likes"] for post in user_posts)
+    user_posts = posts_by_user[user["id"]]
+    total_likes = user_likes[user["id"]]
     summary = {
         "posts_count": len(user_posts),
         "total_likes": total_likes,
@@ -1,4 +1,5 @@
 # sorting_reversing.py
+from operator import itemgetter
 
 # Sample employee data: (name, salary, department)
 employees = [
@@ -11,25 +12,25 @@ employees = [
 ]
 
 # 1. Sort by Salary (ascending)
-employees_by_salary_asc = sorted(employees, key=lambda x: x[1])
+employees_by_salary_asc = sorted(employees, key=itemgetter(1))
 print("Sorted by salary (ascending):")
 print(employees_by_salary_asc)
 print()
 
 # 1. Sort by Salary (descending)
-employees_by_salary_desc = sorted(employees, key=lambda x: x[1], reverse=True)
+employees_by_salary_desc = sorted(employees, key=itemgetter(1), reverse=True)
 print("Sorted by salary (descending):")
 print(employees_by_salary_desc)
 print()
 
 # 2. Sort by Department, then by Salary
-employees_by_dept_salary = sorted(employees, key=lambda x: (x[2], x[1]))
+employees_by_dept_salary = sorted(employees, key=itemgetter(2, 1))
 print("Sorted by department, then by salary:")
 print(employees_by_dept_salary)
 print()
 
 # 3. Create a Reversed List (without modifying original)
-employees_reversed = list(reversed(employees))
+employees_reversed = employees[::-1]
 print("Reversed list (original not modified):")
 print(employees_reversed)
 print()
@@ -43,13 +44,13 @@ print()
 # 5. Demonstrate .sort() vs sorted()
 # Using .sort() (modifies original)
 employees_copy = employees.copy()
-employees_copy.sort(key=lambda x: x[1])  # Sort by salary ascending
+employees_copy.sort(key=itemgetter(1))  # Sort by salary ascending
 print("Using .sort() (modifies list):")
 print(employees_copy)
 print()
 
 # Using sorted() (does not modify original)
-employees_sorted = sorted(employees, key=lambda x: x[1])
+employees_sorted = sorted(employees, key=itemgetter(1))
 print("Using sorted() (original list unchanged):")
 print(employees_sorted)
 print("Original list:")
@@ -1,4 +1,5 @@
 # student_records.py
+from operator import itemgetter
 
 # List of student records as tuples: (student_id, name, grade, age)
 students = [
@@ -9,11 +10,8 @@ students = [
 ]
 
 # 1. Find the Student with the Highest Grade
-# Start by assuming the first student has the highest grade
-top_student = students[0]
-for student in students:
-    if student[2] > top_student[2]:  # Compare grades (index 2)
-        top_student = student
+# max() keeps the first student on ties, like a strict ">" scan; grade is index 2
+top_student = max(students, key=itemgetter(2))
 
 print("Student with the highest grade:")
 print("ID:", top_student[0])
@@ -22,10 +20,7 @@ print("Grade:", top_student[2])
 print("Age:", top_student[3])
 
 # 2. Create a Name-Grade List
-name_grade_list = []
-for student in students:
-    name_grade = (student[1], student[2])  # (name, grade)
-    name_grade_list.append(name_grade)
+name_grade_list = list(map(itemgetter(1, 2), students))  # (name, grade)
 
 print("\nName-Grade List:")
 print(name_grade_list)
@@ -5,8 +5,11 @@ monday_visitors = {"alice", "bob", "carol", "dave"}
 tuesday_visitors = {"bob", "carol", "eve", "frank"}
 wednesday_visitors = {"carol", "dave", "frank", "grace"}
 
+# Monday-or-Tuesday visitors, shared by the unique and new-visitor counts
+mon_tue_visitors = monday_visitors | tuesday_visitors
+
 # 1. Unique Visitors Across All Days
-unique_visitors = monday_visitors | tuesday_visitors | wednesday_visitors
+unique_visitors = mon_tue_visitors | wednesday_visitors
 print("1. Unique Visitors Across All Days:", unique_visitors)
 print("   Total:", len(unique_visitors))
 
@@ -17,7 +20,7 @@ print("\n2. Returning Visitors on Tuesday:", returning_tuesday)
 # 3. New Visitors Each Day (not seen on previous days)
 new_monday = monday_visitors
 new_tuesday = tuesday_visitors - monday_visitors
-new_wednesday = wednesday_visitors - (monday_visitors | tuesday_visitors)
+new_wednesday = wednesday_visitors - mon_tue_visitors
 print("\n3. New Visitors Each Day:")
 print("   Monday:", new_monday)
 print("   Tuesday:", new_tuesday)
@@ -29,6 +32,6 @@ print("\n4. Loyal Visitors (all three days):", loyal_visitors)
 
 # 5. Daily Visitor Overlap Analysis
 print("\n5. Daily Visitor Overlap Analysis:")
-print("   Monday & Tuesday:", monday_visitors & tuesday_visitors)
+print("   Monday & Tuesday:", returning_tuesday)
 print("   Tuesday & Wednesday:", tuesday_visitors & wednesday_visitors)
 print("   Monday & Wednesday:", monday_visitors & wednesday_visitors)
@@ -1,6 +1,9 @@
 # bank_account_management_system.py
 
 class BankAccount:
+    # Fixed attribute layout; subclasses add their own slots
+    __slots__ = ('_account_id', '_holder_name', '_balance')
+
     _bank_name = "National Bank"
     _min_balance = 0
     _account_count = 0
@@ -58,6 +61,8 @@ class BankAccount:
         print(f"Bank: {self._bank_name}")
 
 class SavingsAccount(BankAccount):
+    __slots__ = ('_interest_rate',)
+
     def __init__(self, account_id, holder_name, balance, interest_rate):
         super().__init__(account_id, holder_name, balance)
         if interest_rate < 0:
@@ -72,6 +77,8 @@ class SavingsAccount(BankAccount):
         print(f"Interest Rate: {self._interest_rate}%")
 
 class CheckingAccount(BankAccount):
+    __slots__ = ('_overdraft_limit',)
+
     def __init__(self, account_id, holder_name, balance, overdraft_limit):
         super().__init__(account_id, holder_name, balance)
         if overdraft_limit < 0:
@@ -1,4 +1,6 @@
 # ecommerce_shopping_cart_system.py
+from collections import Counter
+
 
 class Product:
     def __init__(self, product_id, name, price, category, stock_quantity):
@@ -27,15 +29,18 @@ class Customer:
         self.email = email
         self.is_premium = is_premium
         self.orders = []
+        # Orders are only ever appended, so revenue is kept as a running total
+        self._revenue = 0
 
     def get_discount_rate(self):
         return 0.1 if self.is_premium else 0.0
 
     def add_order(self, order):
         self.orders.append(order)
+        self._revenue += order.total_price
 
     def total_revenue(self):
-        return sum(order.total_price for order in self.orders)
+        return self._revenue
 
     def __str__(self):
         return f"{self.name} ({'Premium' if self.is_premium else 'Regular'})"
@@ -46,14 +51,10 @@ class Cart:
         self.items = {}  # product: quantity
 
     def add_product(self, product, quantity):
-        if product in self.items:
-            self.items[product] += quantity
-        else:
-            self.items[product] = quantity
+        self.items[product] = self.items.get(product, 0) + quantity
 
     def remove_product(self, product):
-        if product in self.items:
-            del self.items[product]
+        self.items.pop(product, None)
 
     def clear(self):
         self.items.clear()
@@ -74,29 +75,31 @@ class Order:
     def __init__(self, customer, cart):
         self.customer = customer
         self.items = cart.items.copy()
+        self._subtotal = cart.subtotal()
         self.total_price = self.calculate_total()
         self.completed = False
 
     def calculate_total(self):
-        subtotal = sum(product.price * qty for product, qty in self.items.items())
-        discount = subtotal * self.customer.get_discount_rate()
-        return round(subtotal - discount, 2)
+        discount = self._subtotal * self.customer.get_discount_rate()
+        return round(self._subtotal - discount, 2)
 
     def place_order(self):
-        # Check stock
+        # Reduce stock in one pass, restoring what was taken if any item is short
+        taken = []
         for product, qty in self.items.items():
-            if qty > product.stock_quantity:
+            try:
+                product.reduce_stock(qty)
+            except ValueError:
+                for taken_product, taken_qty in taken:
+                    taken_product.increase_stock(taken_qty)
                 return False
-        # Reduce stock
-        for product, qty in self.items.items():
-            product.reduce_stock(qty)
+            taken.append((product, qty))
         self.completed = True
         self.customer.add_order(self)
         return True
 
 
 def most_popular_category(orders):
-    from collections import Counter
     category_counter = Counter()
     for order in orders:
         for product, qty in order.items.items():
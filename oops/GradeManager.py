@@ -4,12 +4,16 @@ class GradeManager:
     def __init__(self):
         # Each student maps to a dict of subjects and their scores
         self.grades = defaultdict(dict)
+        # Running score total per student, kept in step by add_grade
+        self._totals = defaultdict(int)
 
     def add_grade(self, student, subject, score):
         """
         Adds or updates the score for a student in a subject.
         """
-        self.grades[student][subject] = score
+        subjects = self.grades[student]
+        self._totals[student] += score - subjects.get(subject, 0)
+        subjects[subject] = score
 
     def get_grades(self, student):
         """
@@ -26,7 +30,7 @@ class GradeManager:
         subjects = self.grades.get(student)
         if not subjects:
             return None
-        return sum(subjects.values()) / len(subjects)
+        return self._totals[student] / len(subjects)
 
     def get_all_students(self):
         """
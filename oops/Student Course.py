@@ -1,4 +1,6 @@
 # student_course_management.py
+import heapq
+from operator import itemgetter
 
 class Student:
     _student_count = 0
@@ -6,6 +8,9 @@ class Student:
         self.name = name
         self.program = program
         self.courses = {}  # course: grade
+        # GPA only changes when a grade is recorded, so it is cached until then
+        self._gpa_cache = None
+        self._gpa_dirty = True
         Student._student_count += 1
 
     def enroll(self, course):
@@ -14,20 +19,23 @@ class Student:
     def add_grade(self, course, grade):
         if course in self.courses:
             self.courses[course] = grade
+            self._gpa_dirty = True
             course.add_grade(self, grade)
         else:
             raise Exception(f"{self.name} is not enrolled in {course.title}")
 
     def calculate_gpa(self):
-        if not self.courses:
-            return 0.0
+        if not self._gpa_dirty:
+            return self._gpa_cache
         total = 0
         count = 0
         for grade in self.courses.values():
             if grade is not None:
                 total += grade
                 count += 1
-        return round(total / count, 2) if count else 0.0
+        self._gpa_cache = round(total / count, 2) if count else 0.0
+        self._gpa_dirty = False
+        return self._gpa_cache
 
     def transcript(self):
         lines = [f"Transcript for {self.name}:"]
@@ -51,21 +59,26 @@ class Course:
         self.limit = limit
         self.students = []
         self.waitlist = []
+        # Set mirrors of the ordered lists above for O(1) membership checks
+        self._enrolled = set()
+        self._waitlisted = set()
         self.grades = {}  # student: grade
 
     def add_student(self, student):
-        if student in self.students or student in self.waitlist:
+        if student in self._enrolled or student in self._waitlisted:
             return f"{student.name} is already enrolled or waitlisted in {self.title}."
         if len(self.students) < self.limit:
             self.students.append(student)
+            self._enrolled.add(student)
             student.courses[self] = None
             return f"{student.name} enrolled in {self.title}."
         else:
             self.waitlist.append(student)
+            self._waitlisted.add(student)
             return f"{self.title} is full. {student.name} added to waitlist."
 
     def add_grade(self, student, grade):
-        if student in self.students:
+        if student in self._enrolled:
             self.grades[student] = grade
         else:
             raise Exception(f"{student.name} is not enrolled in {self.title}")
@@ -110,9 +123,9 @@ class University:
         return round(sum(gpas) / len(gpas), 2) if gpas else 0.0
 
     def top_students(self, n=1):
-        students_with_gpa = [(s, s.calculate_gpa()) for s in self.students if s.courses]
-        students_with_gpa.sort(key=lambda x: x[1], reverse=True)
-        return students_with_gpa[:n]
+        # Same result as a stable descending sort sliced to n, without sorting everyone
+        students_with_gpa = ((s, s.calculate_gpa()) for s in self.students if s.courses)
+        return heapq.nlargest(n, students_with_gpa, key=itemgetter(1))
 
 
 # --- Example Usage (as per your image description) ---
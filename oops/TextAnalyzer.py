@@ -1,27 +1,60 @@
+from bisect import bisect_left
 from collections import Counter
+from functools import cached_property
 import re
 
+# Patterns compiled once and shared by every analyzer
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Words left out of find_common_words when exclude_common is set
+_STOPWORDS = frozenset({
+    "the", "is", "in", "and", "to", "of", "a", "for", "on", "with", "as", "by", "an", "at", "from", "that", "this", "it"
+})
+
 class TextAnalyzer:
     def __init__(self, text):
         self.text = text
         self.text_lower = text.lower()
 
+    # Tokenized once on first use and shared by the methods below
+    @cached_property
+    def _words(self):
+        return _WORD_RE.findall(self.text)
+
+    @cached_property
+    def _words_lower(self):
+        return _WORD_RE.findall(self.text_lower)
+
+    @cached_property
+    def _counter_lower(self):
+        return Counter(self._words_lower)
+
     def get_character_frequency(self, include_spaces=False):
+        # Count the text as-is and drop spaces afterwards instead of copying it
+        counts = Counter(self.text)
         if not include_spaces:
-            filtered = self.text.replace(" ", "")
-        else:
-            filtered = self.text
-        return dict(Counter(filtered))
+            counts.pop(" ", None)
+        return dict(counts)
 
     def get_word_frequency(self, min_length=1):
-        words = re.findall(r'\b\w+\b', self.text_lower)
-        filtered_words = [w for w in words if len(w) >= min_length]
-        return dict(Counter(filtered_words))
+        return {w: count for w, count in self._counter_lower.items() if len(w) >= min_length}
 
     def get_sentence_length_distribution(self):
-        sentences = re.split(r'[.!?]+', self.text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        lengths = [len(re.findall(r'\b\w+\b', s)) for s in sentences]
+        text = self.text
+        # Sentences are the spans between terminator runs; count the word starts
+        # inside each span rather than re-tokenizing every sentence separately
+        word_starts = [m.start() for m in _WORD_RE.finditer(text)]
+        terminators = [m.span() for m in _SENT_RE.finditer(text)]
+        terminators.append((len(text), len(text)))
+        lengths = []
+        first_word = sentence_start = 0
+        for sentence_end, next_start in terminators:
+            end_word = bisect_left(word_starts, sentence_end, first_word)
+            # Blank spans are skipped, like the stripped-empty pieces of a split
+            if end_word > first_word or text[sentence_start:sentence_end].strip():
+                lengths.append(end_word - first_word)
+            first_word, sentence_start = end_word, next_start
         distribution = dict(Counter(lengths))
         avg = sum(lengths) / len(lengths) if lengths else 0
         return {
@@ -32,18 +65,18 @@ class TextAnalyzer:
         }
 
     def find_common_words(self, n=10, exclude_common=True):
-        common_english = {
-            "the", "is", "in", "and", "to", "of", "a", "for", "on", "with", "as", "by", "an", "at", "from", "that", "this", "it"
-        }
-        words = re.findall(r'\b\w+\b', self.text_lower)
-        if exclude_common:
-            words = [w for w in words if w not in common_english]
-        freq = Counter(words)
+        if not exclude_common:
+            return self._counter_lower.most_common(n)
+        # Drop the few stopwords from a copy of the cached counts instead of
+        # re-filtering every word in the text
+        freq = self._counter_lower.copy()
+        for word in _STOPWORDS:
+            freq.pop(word, None)
         return freq.most_common(n)
 
     def get_reading_statistics(self):
-        words = re.findall(r'\b\w+\b', self.text)
-        sentences = re.split(r'[.!?]+', self.text)
+        words = self._words
+        sentences = _SENT_RE.split(self.text)
         sentences = [s.strip() for s in sentences if s.strip()]
         char_count = len(self.text)
         word_count = len(words)
@@ -60,8 +93,8 @@ class TextAnalyzer:
         }
 
     def compare_with_text(self, other_text):
-        words1 = set(re.findall(r'\b\w+\b', self.text_lower))
-        words2 = set(re.findall(r'\b\w+\b', other_text.lower()))
+        words1 = set(self._words_lower)
+        words2 = set(_WORD_RE.findall(other_text.lower()))
         common = words1 & words2
         total = words1 | words2
         similarity = len(common) / len(total) if total else 0
@@ -8,23 +8,28 @@ def analyze_friendships():
     twitter_friends = {"alice", "diana", "grace", "jack", "bob", "karen"}
     linkedin_friends = {"charlie", "diana", "frank", "grace", "luke", "mary"}
 
+    # Everyone outside Facebook, reused by the Facebook-only and union counts
+    other_platforms = instagram_friends | twitter_friends | linkedin_friends
+
     # 1. Friends on all four platforms (intersection)
     all_four = facebook_friends & instagram_friends & twitter_friends & linkedin_friends
 
     # 2. Friends only on Facebook (not on any other)
-    only_facebook = facebook_friends - (instagram_friends | twitter_friends | linkedin_friends)
+    only_facebook = facebook_friends - other_platforms
 
     # 3. Friends on Instagram or Twitter but not both (symmetric difference)
     insta_or_twitter_not_both = instagram_friends ^ twitter_friends
 
     # 4. Total unique friends across all platforms (union)
-    total_unique = facebook_friends | instagram_friends | twitter_friends | linkedin_friends
+    total_unique = facebook_friends | other_platforms
 
     # 5. Friends on exactly two platforms
-    from collections import Counter
-    all_friends = list(facebook_friends) + list(instagram_friends) + list(twitter_friends) + list(linkedin_friends)
-    friend_counts = Counter(all_friends)
-    exactly_two = {friend for friend, count in friend_counts.items() if count == 2}
+    # One bit per platform; a friend's mask has one bit set for each platform they are on
+    platform_mask = {}
+    for bit, friends in enumerate((facebook_friends, instagram_friends, twitter_friends, linkedin_friends)):
+        for friend in friends:
+            platform_mask[friend] = platform_mask.get(friend, 0) | (1 << bit)
+    exactly_two = {friend for friend, mask in platform_mask.items() if mask.bit_count() == 2}
 
     return {
         "all_four": all_four,
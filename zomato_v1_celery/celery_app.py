@@ -23,6 +23,9 @@ celery_app.conf.update(
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
+    # Ack after the task finishes, so a task lost with its worker is redelivered
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
     worker_max_tasks_per_child=1000,
     worker_disable_rate_limits=False,
     task_annotations={
@@ -32,5 +35,12 @@ celery_app.conf.update(
     }
 )
 
+celery_app.conf.beat_schedule = {
+    "cleanup-old-tasks": {
+        "task": "cleanup_old_tasks",
+        "schedule": 3600.0,  # Every hour
+    },
+}
+
 if __name__ == "__main__":
     celery_app.start() 
\ No newline at end of file
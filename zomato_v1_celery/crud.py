@@ -1,43 +1,48 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import Restaurant
 from schemas import RestaurantCreate
 
-def get_restaurant(db: Session, restaurant_id: int):
-    return db.query(Restaurant).filter(Restaurant.id == restaurant_id).first()
+async def get_restaurant(db: AsyncSession, restaurant_id: int):
+    # Primary-key lookup: served from the session's identity map when already loaded
+    return await db.get(Restaurant, restaurant_id)
 
-def get_restaurants(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Restaurant).offset(skip).limit(limit).all()
+async def get_restaurants(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(Restaurant).offset(skip).limit(limit))
+    return result.scalars().all()
 
-def create_restaurant(db: Session, restaurant: RestaurantCreate):
+async def create_restaurant(db: AsyncSession, restaurant: RestaurantCreate):
     db_restaurant = Restaurant(**restaurant.dict())
     db.add(db_restaurant)
-    db.commit()
-    db.refresh(db_restaurant)
+    await db.commit()
+    await db.refresh(db_restaurant)
     return db_restaurant
 
-def update_restaurant(db: Session, restaurant_id: int, restaurant: RestaurantCreate):
-    db_restaurant = get_restaurant(db, restaurant_id)
+async def update_restaurant(db: AsyncSession, restaurant_id: int, restaurant: RestaurantCreate):
+    db_restaurant = await get_restaurant(db, restaurant_id)
     if db_restaurant is None:
         return None
-    
+
     for key, value in restaurant.dict().items():
         setattr(db_restaurant, key, value)
-    
-    db.commit()
-    db.refresh(db_restaurant)
+
+    await db.commit()
+    await db.refresh(db_restaurant)
     return db_restaurant
 
-def delete_restaurant(db: Session, restaurant_id: int):
-    db_restaurant = get_restaurant(db, restaurant_id)
+async def delete_restaurant(db: AsyncSession, restaurant_id: int):
+    db_restaurant = await get_restaurant(db, restaurant_id)
     if db_restaurant is None:
         return False
-    
-    db.delete(db_restaurant)
-    db.commit()
+
+    await db.delete(db_restaurant)
+    await db.commit()
     return True
 
-def get_restaurants_by_cuisine(db: Session, cuisine_type: str):
-    return db.query(Restaurant).filter(Restaurant.cuisine_type == cuisine_type).all()
+async def get_restaurants_by_cuisine(db: AsyncSession, cuisine_type: str):
+    result = await db.execute(select(Restaurant).where(Restaurant.cuisine_type == cuisine_type))
+    return result.scalars().all()
 
-def get_restaurants_by_rating(db: Session, min_rating: float):
-    return db.query(Restaurant).filter(Restaurant.rating >= min_rating).all() 
\ No newline at end of file
+async def get_restaurants_by_rating(db: AsyncSession, min_rating: float):
+    result = await db.execute(select(Restaurant).where(Restaurant.rating >= min_rating))
+    return result.scalars().all()
@@ -1,20 +1,73 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm import Session
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./restaurants.db"
+# Same database through the aiosqlite driver, for the API
+ASYNC_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
 
+# Sync engine, used by the Celery workers
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One session per worker thread, handed out to the tasks that thread runs
+TaskSession = scoped_session(SessionLocal)
+
+# Async engine, so API requests don't block the event loop on database I/O
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, connect_args={"check_same_thread": False}
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+# The API request's session, set by DBSessionMiddleware
+_request_session: ContextVar[AsyncSession] = ContextVar("request_session")
+
+def current_session() -> AsyncSession:
+    return _request_session.get()
+
+class DBSessionMiddleware:
+    """
+    Pure ASGI middleware giving each HTTP request one AsyncSession, reachable
+    through current_session(). It stays unbound until a query needs a connection.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        async with AsyncSessionLocal() as db:
+            token = _request_session.set(db)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _request_session.reset(token)
+
+@contextmanager
+def task_session() -> Iterator[Session]:
+    """Session scope for a Celery task: commit on success, roll back on error, then release it."""
+    db = TaskSession()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
-        db.close() 
\ No newline at end of file
+        TaskSession.remove()
+
+async def create_tables():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
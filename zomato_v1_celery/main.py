@@ -1,26 +1,31 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-import uuid
+import asyncio
+import os
+import time
 
-from database import engine, get_db
-from models import Base
-from schemas import RestaurantCreate, Restaurant, TaskStatus, TaskCreate
+from database import DBSessionMiddleware, create_tables, current_session
+from schemas import RestaurantCreate, Restaurant, TaskStatus, TaskCreate, restaurant_list_adapter
 from crud import (
     create_restaurant, get_restaurants, get_restaurant, 
     update_restaurant, delete_restaurant
 )
 from celery_app import celery_app
+from task_store import task_store
 from tasks import (
     generate_restaurant_report, sync_restaurant_data, 
-    send_restaurant_notifications
+    send_restaurant_notifications, report_cache_key
 )
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="Zomato-like Food Delivery System", version="1.0.0")
+app = FastAPI(
+    title="Zomato-like Food Delivery System",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # CORS middleware
 app.add_middleware(
@@ -31,115 +36,233 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory task storage (in production, use Redis or database)
-task_store: Dict[str, TaskStatus] = {}
+# One database session per request, read by handlers through current_session()
+app.add_middleware(DBSessionMiddleware)
+
+@app.on_event("startup")
+async def startup_event():
+    # Create database tables, unless the deployment manages the schema itself
+    if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+        await create_tables()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await task_store.close()
 
 @app.get("/")
 def read_root():
     return {"message": "Zomato-like Food Delivery System with Celery"}
 
+async def _invalidate_reports(*cuisine_types: str):
+    # Drop cached reports for cuisines whose restaurants just changed
+    await task_store.redis.delete(*{report_cache_key(c) for c in cuisine_types})
+
 # Restaurant endpoints
 @app.post("/restaurants/", response_model=Restaurant)
-def create_restaurant_endpoint(restaurant: RestaurantCreate, db=Depends(get_db)):
-    return create_restaurant(db=db, restaurant=restaurant)
+async def create_restaurant_endpoint(restaurant: RestaurantCreate):
+    db = current_session()
+    created_restaurant = await create_restaurant(db=db, restaurant=restaurant)
+    await _invalidate_reports(created_restaurant.cuisine_type)
+    return created_restaurant
 
 @app.get("/restaurants/", response_model=List[Restaurant])
-def read_restaurants(skip: int = 0, limit: int = 100, db=Depends(get_db)):
-    restaurants = get_restaurants(db, skip=skip, limit=limit)
-    return restaurants
+async def read_restaurants(skip: int = 0, limit: int = 100):
+    db = current_session()
+    restaurants = await get_restaurants(db, skip=skip, limit=limit)
+    # Already validated and serialized, so FastAPI's own response pass is skipped
+    body = restaurant_list_adapter.dump_json(restaurant_list_adapter.validate_python(restaurants))
+    return Response(content=body, media_type="application/json")
 
 @app.get("/restaurants/{restaurant_id}", response_model=Restaurant)
-def read_restaurant(restaurant_id: int, db=Depends(get_db)):
-    restaurant = get_restaurant(db, restaurant_id=restaurant_id)
+async def read_restaurant(restaurant_id: int):
+    db = current_session()
+    restaurant = await get_restaurant(db, restaurant_id=restaurant_id)
     if restaurant is None:
         raise HTTPException(status_code=404, detail="Restaurant not found")
     return restaurant
 
 @app.put("/restaurants/{restaurant_id}", response_model=Restaurant)
-def update_restaurant_endpoint(restaurant_id: int, restaurant: RestaurantCreate, db=Depends(get_db)):
-    updated_restaurant = update_restaurant(db, restaurant_id, restaurant)
+async def update_restaurant_endpoint(restaurant_id: int, restaurant: RestaurantCreate):
+    db = current_session()
+    existing_restaurant = await get_restaurant(db, restaurant_id)
+    if existing_restaurant is None:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    # The update may move the restaurant to another cuisine, so both reports are stale
+    old_cuisine_type = existing_restaurant.cuisine_type
+    updated_restaurant = await update_restaurant(db, restaurant_id, restaurant)
     if updated_restaurant is None:
         raise HTTPException(status_code=404, detail="Restaurant not found")
+    await _invalidate_reports(old_cuisine_type, updated_restaurant.cuisine_type)
     return updated_restaurant
 
 @app.delete("/restaurants/{restaurant_id}")
-def delete_restaurant_endpoint(restaurant_id: int, db=Depends(get_db)):
-    success = delete_restaurant(db, restaurant_id)
+async def delete_restaurant_endpoint(restaurant_id: int):
+    db = current_session()
+    existing_restaurant = await get_restaurant(db, restaurant_id)
+    if existing_restaurant is None:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    cuisine_type = existing_restaurant.cuisine_type
+    success = await delete_restaurant(db, restaurant_id)
     if not success:
         raise HTTPException(status_code=404, detail="Restaurant not found")
+    await _invalidate_reports(cuisine_type)
     return {"message": "Restaurant deleted successfully"}
 
-# Celery task endpoints
-@app.post("/tasks/generate-report/{cuisine_type}")
-def start_report_generation(cuisine_type: str):
-    task_id = str(uuid.uuid4())
+def _apply_celery_meta(task: TaskStatus, meta: Dict[str, Any]) -> TaskStatus:
+    task.status = meta["status"]
+    info = meta["result"]
+    if task.status == "PROGRESS":
+        task.progress = (info or {}).get("progress", 0)
+    elif task.status in ("SUCCESS", "FAILURE"):
+        # The Redis backend stores date_done as an ISO string
+        done = meta.get("date_done")
+        task.completed_at = datetime.fromisoformat(done) if isinstance(done, str) else done
+        if task.status == "SUCCESS":
+            task.progress = 100
+            task.result = info
+        else:
+            task.error = str(info)
+    return task
+
+def _with_celery_state(task: TaskStatus) -> TaskStatus:
+    """
+    Fill in a task's live status from Celery's result backend.
+    The task store only records submission and cancellation.
+    """
+    if task.status == "CANCELLED":
+        return task
+
+    # One backend read for state, progress meta and result
+    return _apply_celery_meta(task, celery_app.backend.get_task_meta(task.task_id))
+
+def _with_celery_states(tasks: List[TaskStatus]) -> List[TaskStatus]:
+    """
+    Same as _with_celery_state for many tasks, with one MGET for all their results
+    """
+    live = [task for task in tasks if task.status != "CANCELLED"]
+    if live:
+        backend = celery_app.backend
+        raws = backend.mget([backend.get_key_for_task(task.task_id) for task in live])
+        for task, raw in zip(live, raws):
+            # No stored meta yet means Celery still reports the task as PENDING
+            meta = backend.decode_result(raw) if raw is not None else {"status": "PENDING", "result": None}
+            _apply_celery_meta(task, meta)
+    return tasks
+
+async def _submit(celery_task) -> TaskStatus:
+    # A duplicate request gets the queued or running task's id back; keep its record
+    existing = await task_store.get(celery_task.id)
+    if existing is not None:
+        return existing
+
+    # The Celery task id doubles as the public task id
     task = TaskStatus(
-        task_id=task_id,
+        task_id=celery_task.id,
         status="PENDING",
         progress=0,
         started_at=datetime.utcnow()
     )
-    task_store[task_id] = task
-    
-    # Start Celery task
-    celery_task = generate_restaurant_report.delay(cuisine_type)
-    task_store[task_id].result = {"celery_task_id": celery_task.id}
+    await task_store.set(task)
+    return task
+
+# Celery task endpoints
+@app.post("/tasks/generate-report/{cuisine_type}")
+async def start_report_generation(cuisine_type: str):
+    # Start Celery task; the publish and Singleton's lock calls block, so off the event loop
+    task = await _submit(await run_in_threadpool(generate_restaurant_report.delay, cuisine_type))
     
-    return {"task_id": task_id, "message": "Report generation started"}
+    return {"task_id": task.task_id, "message": "Report generation started"}
 
 @app.get("/tasks/status/{task_id}")
-def get_task_status(task_id: str):
-    if task_id not in task_store:
+async def get_task_status(task_id: str):
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task_store[task_id]
+    return await run_in_threadpool(_with_celery_state, task)
 
 @app.get("/tasks/list")
-def list_tasks():
-    return list(task_store.values())
+async def list_tasks(status: Optional[str] = None):
+    tasks = await task_store.list()
+    tasks = await run_in_threadpool(_with_celery_states, tasks)
+    if status is not None:
+        tasks = [task for task in tasks if task.status == status]
+    return tasks
 
 @app.delete("/tasks/cancel/{task_id}")
-def cancel_task(task_id: str):
-    if task_id not in task_store:
+async def cancel_task(task_id: str):
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = task_store[task_id]
-    if task.status in ["SUCCESS", "FAILURE"]:
+    task = await run_in_threadpool(_with_celery_state, task)
+    if task.status in ["SUCCESS", "FAILURE", "CANCELLED"]:
         raise HTTPException(status_code=400, detail="Cannot cancel completed task")
     
-    # Cancel Celery task if it exists
-    if task.result and "celery_task_id" in task.result:
-        celery_app.control.revoke(task.result["celery_task_id"], terminate=True)
+    # Cancel Celery task
+    await run_in_threadpool(celery_app.control.revoke, task_id, terminate=True)
     
     task.status = "CANCELLED"
     task.completed_at = datetime.utcnow()
+    await task_store.set(task)
     
     return {"message": "Task cancelled successfully"}
 
-@app.post("/restaurants/{restaurant_id}/sync")
-def sync_restaurant_endpoint(restaurant_id: int):
-    task_id = str(uuid.uuid4())
-    task = TaskStatus(
-        task_id=task_id,
-        status="PENDING",
-        progress=0,
-        started_at=datetime.utcnow()
-    )
-    task_store[task_id] = task
+@app.post("/tasks/cancel-batch")
+async def cancel_tasks(task_ids: List[str]):
+    stored = await task_store.get_many(task_ids)
+    found = [task for task in stored if task is not None]
+    found = await run_in_threadpool(_with_celery_states, found)
+    to_cancel = [task for task in found if task.status not in ["SUCCESS", "FAILURE", "CANCELLED"]]
     
-    # Start Celery task
-    celery_task = sync_restaurant_data.delay(restaurant_id)
-    task_store[task_id].result = {"celery_task_id": celery_task.id}
+    if to_cancel:
+        # A single revoke broadcast covers every task in the batch
+        await run_in_threadpool(
+            celery_app.control.revoke, [task.task_id for task in to_cancel], terminate=True
+        )
+        completed_at = datetime.utcnow()
+        for task in to_cancel:
+            task.status = "CANCELLED"
+            task.completed_at = completed_at
+        await task_store.set_many(to_cancel)
     
-    return {"task_id": task_id, "message": "Restaurant sync started"}
+    cancelled = {task.task_id for task in to_cancel}
+    return {
+        "message": f"Cancelled {len(cancelled)} of {len(task_ids)} tasks",
+        "cancelled": [task_id for task_id in task_ids if task_id in cancelled],
+        "not_cancelled": [task_id for task_id in task_ids if task_id not in cancelled]
+    }
+
+@app.post("/restaurants/{restaurant_id}/sync")
+async def sync_restaurant_endpoint(restaurant_id: int):
+    # Start Celery task off the event loop
+    task = await _submit(await run_in_threadpool(sync_restaurant_data.delay, restaurant_id))
+    
+    return {"task_id": task.task_id, "message": "Restaurant sync started"}
+
+# Broadcast inspector reused by the worker status endpoint; a dead worker
+# delays a reply by at most a second instead of the default ten
+_inspector = celery_app.control.inspect(timeout=1.0)
+
+# Worker status is served from memory for a few seconds, so dashboards polling
+# the endpoint don't each trigger a broadcast to every worker
+WORKER_STATUS_TTL_SECONDS = 5
+_worker_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
 @app.get("/workers/status")
-def get_worker_status():
+async def get_worker_status():
+    global _worker_status_cache
+    now = time.monotonic()
+    if _worker_status_cache is not None and now - _worker_status_cache[0] < WORKER_STATUS_TTL_SECONDS:
+        return _worker_status_cache[1]
+
     try:
-        # Get active workers
-        active_workers = celery_app.control.inspect().active()
-        registered_workers = celery_app.control.inspect().registered()
+        # Get active and registered workers, both broadcasts in flight at once
+        active_workers, registered_workers = await asyncio.gather(
+            asyncio.to_thread(_inspector.active),
+            asyncio.to_thread(_inspector.registered),
+        )
         
-        return {
+        worker_status = {
             "active_workers": active_workers or {},
             "registered_workers": registered_workers or {},
             "total_workers": len(active_workers) if active_workers else 0
@@ -147,6 +270,9 @@ def get_worker_status():
     except Exception as e:
         return {"error": str(e), "workers": {}}
 
+    _worker_status_cache = (now, worker_status)
+    return worker_status
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Index
 from sqlalchemy.sql import func
 from database import Base
 
@@ -7,11 +7,19 @@ class Restaurant(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
-    cuisine_type = Column(String, index=True)
+    cuisine_type = Column(String)
     address = Column(Text)
     phone = Column(String)
     rating = Column(Float, default=0.0)
     price_range = Column(String, default="$$")
     description = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Both lead with cuisine_type, so they also serve plain cuisine lookups
+    __table_args__ = (
+        # Top-rated restaurants of a cuisine, read straight off the index
+        Index("ix_restaurants_cuisine_rating", cuisine_type, rating.desc()),
+        # Covers the report's per-price-range counts and rating sums
+        Index("ix_restaurants_cuisine_price", cuisine_type, price_range, rating),
+    ) 
\ No newline at end of file
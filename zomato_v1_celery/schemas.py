@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 class RestaurantBase(BaseModel):
@@ -19,12 +19,11 @@ class Restaurant(RestaurantBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TaskStatus(BaseModel):
     task_id: str
-    status: str  # PENDING, PROCESSING, SUCCESS, FAILURE, CANCELLED
+    status: str  # Celery state (PENDING, STARTED, PROGRESS, RETRY, SUCCESS, FAILURE) or CANCELLED
     progress: Optional[int] = 0
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
@@ -33,4 +32,7 @@ class TaskStatus(BaseModel):
 
 class TaskCreate(BaseModel):
     task_type: str
-    parameters: Dict[str, Any] 
\ No newline at end of file
+    parameters: Dict[str, Any] 
+
+# Validates and serializes a whole page of restaurants in one pydantic-core call
+restaurant_list_adapter = TypeAdapter(List[Restaurant])
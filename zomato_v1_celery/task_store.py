@@ -0,0 +1,76 @@
+"""
+Task Store
+Keeps API task records in Redis so every uvicorn worker sees the same tasks
+"""
+
+from typing import List, Optional
+import redis.asyncio as redis
+
+from celery_app import CELERY_BROKER_URL
+from schemas import TaskStatus
+
+# Records expire a day after their last update
+TASK_TTL_SECONDS = 24 * 60 * 60
+TASK_INDEX_KEY = "tasks:index"
+
+def task_key(task_id: str) -> str:
+    return f"task:{task_id}"
+
+class TaskStore:
+    def __init__(self, url: str):
+        # from_url gives the client its own connection pool, shared by all requests
+        self.redis = redis.Redis.from_url(url, decode_responses=True)
+
+    async def get(self, task_id: str) -> Optional[TaskStatus]:
+        raw = await self.redis.get(task_key(task_id))
+        if raw is None:
+            return None
+        return TaskStatus.model_validate_json(raw)
+
+    async def get_many(self, task_ids: List[str]) -> List[Optional[TaskStatus]]:
+        if not task_ids:
+            return []
+        raws = await self.redis.mget([task_key(task_id) for task_id in task_ids])
+        return [TaskStatus.model_validate_json(raw) if raw is not None else None for raw in raws]
+
+    async def set(self, task: TaskStatus):
+        await self.set_many([task])
+
+    async def set_many(self, tasks: List[TaskStatus]):
+        if not tasks:
+            return
+        # One round-trip for any number of records
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for task in tasks:
+                pipe.set(task_key(task.task_id), task.model_dump_json(), ex=TASK_TTL_SECONDS)
+            pipe.sadd(TASK_INDEX_KEY, *(task.task_id for task in tasks))
+            await pipe.execute()
+
+    async def list(self) -> List[TaskStatus]:
+        task_ids = list(await self.redis.smembers(TASK_INDEX_KEY))
+        if not task_ids:
+            return []
+        raws = await self.redis.mget([task_key(task_id) for task_id in task_ids])
+
+        tasks = []
+        expired = []
+        for task_id, raw in zip(task_ids, raws):
+            if raw is None:
+                expired.append(task_id)
+            else:
+                tasks.append(TaskStatus.model_validate_json(raw))
+        # Drop index entries whose records have expired
+        if expired:
+            await self.redis.srem(TASK_INDEX_KEY, *expired)
+        return tasks
+
+    async def delete(self, task_id: str):
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(task_key(task_id))
+            pipe.srem(TASK_INDEX_KEY, task_id)
+            await pipe.execute()
+
+    async def close(self):
+        await self.redis.aclose()
+
+task_store = TaskStore(CELERY_BROKER_URL)
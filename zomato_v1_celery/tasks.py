@@ -1,122 +1,162 @@
-from celery_app import celery_app
-from database import SessionLocal
+from celery.signals import task_revoked
+from celery_app import celery_app, CELERY_BROKER_URL
+from celery_singleton import Singleton
+from database import task_session
 from models import Restaurant
-from crud import get_restaurants_by_cuisine, get_restaurant
-import time
+from redis import Redis
+from sqlalchemy import func, select, update
+from task_store import TASK_INDEX_KEY, task_key
+import json
 import random
 from datetime import datetime
 from typing import Dict, Any
 
-@celery_app.task(bind=True, name="generate_restaurant_report")
+# Finished reports are cached per cuisine; writes to that cuisine's restaurants drop the entry
+REPORT_CACHE_TTL_SECONDS = 60
+redis_client = Redis.from_url(CELERY_BROKER_URL, decode_responses=True)
+
+def report_cache_key(cuisine_type: str) -> str:
+    return f"report:{cuisine_type}"
+
+# Singleton: while a report for a cuisine is queued or running, another request
+# for it gets the existing task back instead of enqueuing a duplicate
+@celery_app.task(
+    bind=True,
+    base=Singleton,
+    unique_on=["cuisine_type"],
+    lock_expiry=300,
+    name="generate_restaurant_report",
+)
 def generate_restaurant_report(self, cuisine_type: str):
     """
     Generate comprehensive restaurant analytics for a specific cuisine type
     """
+    cached = redis_client.get(report_cache_key(cuisine_type))
+    if cached is not None:
+        return json.loads(cached)
+
     try:
-        # Update progress: 0% -> 25% -> 50% -> 75% -> 100%
-        self.update_state(state="PROGRESS", meta={"progress": 0})
-        time.sleep(2)  # Simulate processing time
+        with task_session() as db:
+            # Progress is reported after each query: 50% -> 75% -> 100%
+            # Aggregate in the database instead of loading every restaurant of the cuisine
+            in_cuisine = Restaurant.cuisine_type == cuisine_type
+            # One grouped pass gives the price-range breakdown and, summed over the
+            # groups, the totals behind the restaurant count and average rating
+            restaurant_count = func.count(Restaurant.id)
+            price_range_rows = db.execute(
+                select(
+                    Restaurant.price_range,
+                    restaurant_count,
+                    func.sum(Restaurant.rating),
+                    func.count(Restaurant.rating),
+                )
+                .where(in_cuisine)
+                .group_by(Restaurant.price_range)
+                .order_by(restaurant_count.desc())
+            ).all()
+        
+            # Calculate analytics
+            total_restaurants = sum(row[1] for row in price_range_rows)
+            if total_restaurants == 0:
+                return {
+                    "cuisine_type": cuisine_type,
+                    "total_restaurants": 0,
+                    "average_rating": 0,
+                    "popular_price_ranges": [],
+                    "message": "No restaurants found for this cuisine type"
+                }
         
-        # Get restaurants by cuisine type
-        db = SessionLocal()
-        restaurants = get_restaurants_by_cuisine(db, cuisine_type)
+            # Same as AVG(rating): restaurants without a rating are left out
+            rating_total = sum(row[2] or 0 for row in price_range_rows)
+            rated_restaurants = sum(row[3] for row in price_range_rows)
+            average_rating = rating_total / rated_restaurants if rated_restaurants else 0
+            popular_price_ranges = [(price_range, count) for price_range, count, _, _ in price_range_rows]
         
-        self.update_state(state="PROGRESS", meta={"progress": 25})
-        time.sleep(2)
+            self.update_state(state="PROGRESS", meta={"progress": 50})
         
-        # Calculate analytics
-        total_restaurants = len(restaurants)
-        if total_restaurants == 0:
-            return {
-                "cuisine_type": cuisine_type,
-                "total_restaurants": 0,
-                "average_rating": 0,
-                "popular_price_ranges": [],
-                "message": "No restaurants found for this cuisine type"
-            }
+            # Only the top five rows and the columns the report shows
+            top_restaurants = db.execute(
+                select(Restaurant.id, Restaurant.name, Restaurant.rating, Restaurant.price_range)
+                .where(in_cuisine)
+                .order_by(Restaurant.rating.desc(), Restaurant.id)
+                .limit(5)
+            ).all()
         
-        # Calculate average rating
-        total_rating = sum(r.rating for r in restaurants)
-        average_rating = total_rating / total_restaurants
-        
-        self.update_state(state="PROGRESS", meta={"progress": 50})
-        time.sleep(2)
-        
-        # Analyze price ranges
-        price_ranges = {}
-        for restaurant in restaurants:
-            price_range = restaurant.price_range
-            price_ranges[price_range] = price_ranges.get(price_range, 0) + 1
-        
-        popular_price_ranges = sorted(price_ranges.items(), key=lambda x: x[1], reverse=True)
-        
-        self.update_state(state="PROGRESS", meta={"progress": 75})
-        time.sleep(2)
-        
-        # Generate report
-        report = {
-            "cuisine_type": cuisine_type,
-            "total_restaurants": total_restaurants,
-            "average_rating": round(average_rating, 2),
-            "popular_price_ranges": popular_price_ranges,
-            "top_restaurants": [
-                {
-                    "id": r.id,
-                    "name": r.name,
-                    "rating": r.rating,
-                    "price_range": r.price_range
-                }
-                for r in sorted(restaurants, key=lambda x: x.rating, reverse=True)[:5]
-            ],
-            "generated_at": datetime.utcnow().isoformat()
-        }
+            self.update_state(state="PROGRESS", meta={"progress": 75})
         
-        self.update_state(state="PROGRESS", meta={"progress": 100})
-        time.sleep(1)
+            # Generate report
+            report = {
+                "cuisine_type": cuisine_type,
+                "total_restaurants": total_restaurants,
+                "average_rating": round(average_rating, 2),
+                "popular_price_ranges": popular_price_ranges,
+                "top_restaurants": [row._asdict() for row in top_restaurants],
+                "generated_at": datetime.utcnow().isoformat()
+            }
         
-        db.close()
-        return report
+            redis_client.set(report_cache_key(cuisine_type), json.dumps(report), ex=REPORT_CACHE_TTL_SECONDS)
+            self.update_state(state="PROGRESS", meta={"progress": 100})
         
+            return report
+
     except Exception as e:
-        db.close()
+        # The retry is re-sent under this task's id, which would still hold the
+        # cuisine's lock and be turned away as its own duplicate
+        self.release_lock(task_kwargs={"cuisine_type": cuisine_type})
         raise self.retry(exc=e, countdown=60, max_retries=3)
 
-@celery_app.task(name="sync_restaurant_data")
+@task_revoked.connect
+def release_revoked_singleton_lock(sender=None, request=None, **kwargs):
+    # Revoked tasks never reach on_success/on_failure, where Singleton drops its lock
+    if isinstance(sender, Singleton):
+        sender.release_lock(task_args=request.args, task_kwargs=request.kwargs)
+
+# Not idempotent (it averages into the stored rating), so ack early and never
+# redeliver, and allow only one queued or running sync per restaurant
+@celery_app.task(
+    base=Singleton,
+    unique_on=["restaurant_id"],
+    lock_expiry=300,
+    acks_late=False,
+    name="sync_restaurant_data",
+)
 def sync_restaurant_data(restaurant_id: int):
     """
     Sync restaurant information with external APIs
     """
     try:
-        db = SessionLocal()
-        restaurant = get_restaurant(db, restaurant_id)
-        
-        if not restaurant:
-            db.close()
+        # Simulate updating restaurant data from external sources
+        # In a real implementation, this would call Google Maps API, Yelp API, etc.
+        external_rating = round(random.uniform(3.0, 5.0), 1)
+        
+        with task_session() as db:
+            # Average the external rating in with one UPDATE ... RETURNING, rather
+            # than loading the restaurant first and flushing the change afterwards
+            restaurant = db.execute(
+                update(Restaurant)
+                .where(Restaurant.id == restaurant_id)
+                .values(rating=(Restaurant.rating + external_rating) / 2)
+                .returning(Restaurant.name, Restaurant.cuisine_type)
+            ).one_or_none()
+        
+        if restaurant is None:
             return {"error": "Restaurant not found", "restaurant_id": restaurant_id}
         
-        # Simulate external API calls
-        time.sleep(3)  # Simulate API call delay
+        # The rating is committed once the session block exits
+        redis_client.delete(report_cache_key(restaurant.cuisine_type))
         
-        # Simulate updating restaurant data from external sources
-        # In a real implementation, this would call Google Maps API, Yelp API, etc.
         updated_data = {
             "restaurant_id": restaurant_id,
             "name": restaurant.name,
-            "external_rating": round(random.uniform(3.0, 5.0), 1),
+            "external_rating": external_rating,
             "external_reviews_count": random.randint(10, 500),
             "last_synced": datetime.utcnow().isoformat(),
             "sync_status": "success"
         }
         
-        # Simulate updating the restaurant with external data
-        restaurant.rating = (restaurant.rating + updated_data["external_rating"]) / 2
-        db.commit()
-        
-        db.close()
         return updated_data
         
     except Exception as e:
-        db.close()
         return {"error": str(e), "restaurant_id": restaurant_id}
 
 @celery_app.task(name="send_restaurant_notifications")
@@ -125,9 +165,6 @@ def send_restaurant_notifications(restaurant_data: Dict[str, Any], notification_
     Send notifications about restaurant updates
     """
     try:
-        # Simulate notification processing
-        time.sleep(2)
-        
         notification_result = {
             "restaurant_id": restaurant_data.get("id"),
             "restaurant_name": restaurant_data.get("name"),
@@ -164,14 +201,22 @@ def send_restaurant_notifications(restaurant_data: Dict[str, Any], notification_
 @celery_app.task(name="cleanup_old_tasks")
 def cleanup_old_tasks():
     """
-    Cleanup old completed tasks from result backend
+    Cleanup the task index entries of expired task records
     """
     try:
-        # This would typically clean up old task results from Redis
-        # For this demo, we'll just return a success message
+        # Task records and Celery results expire on their own (after a day); only
+        # the index set needs sweeping, or it grows when nobody lists tasks
+        task_ids = list(redis_client.smembers(TASK_INDEX_KEY))
+        expired = []
+        if task_ids:
+            records = redis_client.mget([task_key(task_id) for task_id in task_ids])
+            expired = [task_id for task_id, record in zip(task_ids, records) if record is None]
+        if expired:
+            redis_client.srem(TASK_INDEX_KEY, *expired)
+        
         return {
             "cleanup_status": "completed",
-            "cleaned_tasks": random.randint(10, 50),
+            "cleaned_tasks": len(expired),
             "cleaned_at": datetime.utcnow().isoformat()
         }
     except Exception as e:
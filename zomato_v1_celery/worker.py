@@ -4,6 +4,8 @@ Celery Worker Entry Point
 This file starts the Celery worker process
 """
 
+import os
+
 from celery_app import celery_app
 
 if __name__ == "__main__":
@@ -11,7 +13,8 @@ if __name__ == "__main__":
         argv=[
             "worker",
             "--loglevel=info",
-            "--concurrency=2",
-            "--pool=prefork"
+            f"--concurrency={os.getenv('CELERY_WORKER_CONCURRENCY', '2')}",
+            "--pool=prefork",
+            "-Ofair"
         ]
     ) 
\ No newline at end of file